@@ -295,11 +295,7 @@ if watchdog_enabled:
 state_manager = StateManager(watchdog=wdt if watchdog_enabled else None)
 
 # Register minimal components for pH3
-state_manager.register_component("wifi")
-state_manager.register_component("time")
-state_manager.register_component("temperature")
-state_manager.register_component("mqtt")
-state_manager.register_component("display")
+state_manager.register_components(("wifi", "time", "temperature", "mqtt", "display"))
 
 # Initialize RTD sensor
 print("🌡️ Initializing RTD sensor...")
@@ -323,16 +319,15 @@ except Exception as e:
 # Initialize TFT display with shared SPI
 print("🖥️ Initializing TFT display with shared SPI...")
 try:
-    from lib.oled_display.oled_display import (
-        initialize_display,
-        create_display_group,
-    )
-
-    display = initialize_display(shared_spi=spi)
-    display_group, ph_label, temp_c_label, temp_f_label, rssi_label, time_label = (
-        create_display_group()
-    )
-    display.root_group = display_group
+    from lib.oled_display.oled_display import DisplayHandles
+
+    display_handles = DisplayHandles.ensure(shared_spi=spi)
+    display = display_handles.display
+    ph_label = display_handles.ph
+    temp_c_label = display_handles.tc
+    temp_f_label = display_handles.tf
+    rssi_label = display_handles.rssi
+    time_label = display_handles.time
     print("✅ TFT display initialized successfully")
     state_manager.update_component_health("display", "healthy")
 
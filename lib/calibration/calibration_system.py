@@ -5,11 +5,61 @@ Complete calibration interface matching main system architecture
 Uses same RTD and pH sensor setup as main monitoring system
 """
 
+import gc
 import time
 import board
-import digitalio
 import busio
+import keypad
 import sys
+from micropython import const
+
+# Timing constants (integers so const() can inline them)
+_BUTTON_DEBOUNCE_MS = const(500)
+_SENSOR_UPDATE_S = const(2)
+_SPLASH_DURATION_S = const(10)
+_EZO_PROCESSING_MS = const(1600)
+_TEMP_COMP_THRESHOLD_MILLIC = const(50)  # 0.05 °C
+
+# Serial status logging in the calibration loop (USB-CDC prints can block)
+_DEBUG = False
+_OK = "OK"
+_FAIL = "FAIL"
+
+# keypad.Keys key numbers for the calibration buttons
+_NEXT_KEY = 0  # D13
+_ABORT_KEY = 1  # D11
+
+
+class _SensorState:
+    """Calibration sensor handles and status (fixed slots, no per-access dict hashing)"""
+
+    __slots__ = (
+        "rtd_working",
+        "rtd_sensor",
+        "ph_working",
+        "ph_sensor",
+        "cal_status",
+        "last_comp_temp",
+    )
+
+    def __init__(self):
+        self.rtd_working = False
+        self.rtd_sensor = None
+        self.ph_working = False
+        self.ph_sensor = None
+        self.cal_status = None
+        self.last_comp_temp = None
+
+
+class _Labels:
+    """Operating screen labels updated by the calibration loop"""
+
+    __slots__ = ("ph", "temp", "cal_status")
+
+    def __init__(self, ph, temp, cal_status):
+        self.ph = ph
+        self.temp = temp
+        self.cal_status = cal_status
 
 
 def run_calibration_mode():
@@ -59,6 +109,11 @@ def run_calibration_mode():
     if not success:
         return False
 
+    # Drop the splash group (still held by root_group) and reclaim it before
+    # the operating screen allocates a similar set of objects
+    display.root_group = None
+    gc.collect()
+
     # === OPERATING SCREEN ===
     main_group, labels = _create_operating_screen(display)
     if not main_group:
@@ -122,16 +177,11 @@ def _show_calibration_splash(display):
 
         # 10-second countdown
         splash_start = time.monotonic()
-        splash_duration = 10.0
+        splash_duration = _SPLASH_DURATION_S
 
         while time.monotonic() - splash_start < splash_duration:
             remaining = splash_duration - (time.monotonic() - splash_start)
             status_label.text = f"Loading calibration interface... {remaining:.0f}s"
-
-            # Re-assert display control
-            if int(remaining) % 2 == 0:
-                display.root_group = splash
-
             time.sleep(0.1)
 
         print("   🎨 Splash complete, switching to operating screen...")
@@ -223,7 +273,7 @@ def _create_operating_screen(display):
         print("   ✅ Operating screen displayed")
 
         # Return screen and key labels for updates
-        labels = {"ph": ph_label, "temp": temp_label, "cal_status": cal_status_label}
+        labels = _Labels(ph_label, temp_label, cal_status_label)
 
         return main_group, labels
 
@@ -236,12 +286,7 @@ def _initialize_sensors(spi):
     """Initialize calibration sensors - SAME setup as main system"""
     print("   🔧 Initializing sensors using main system architecture...")
 
-    sensors = {
-        "rtd_working": False,
-        "rtd_sensor": None,
-        "ph_working": False,
-        "ph_sensor": None,
-    }
+    sensors = _SensorState()
 
     # Setup I2C bus - SAME as main system
     try:
@@ -266,8 +311,8 @@ def _initialize_sensors(spi):
             temp_c, temp_source = rtd_sensor.read_temperature()
             if temp_c is not None:
                 print(f"   ✅ RTD working: {temp_c:.3f}°C from {temp_source}")
-                sensors["rtd_working"] = True
-                sensors["rtd_sensor"] = rtd_sensor
+                sensors.rtd_working = True
+                sensors.rtd_sensor = rtd_sensor
             else:
                 print(f"   ❌ RTD read failed: {temp_source}")
         else:
@@ -294,16 +339,16 @@ def _initialize_sensors(spi):
         if test_ph and device_info:
             print(f"   ✅ pH working: {test_ph}")
             print(f"   📊 pH device: {device_info}")
-            sensors["ph_working"] = True
-            sensors["ph_sensor"] = ph_sensor
+            sensors.ph_working = True
+            sensors.ph_sensor = ph_sensor
         else:
             print("   ❌ pH sensor not responding")
 
     except Exception as e:
         print(f"   ❌ pH initialization error: {e}")
 
-    rtd_status = "✅" if sensors["rtd_working"] else "❌"
-    ph_status = "✅" if sensors["ph_working"] else "❌"
+    rtd_status = _OK if sensors.rtd_working else _FAIL
+    ph_status = _OK if sensors.ph_working else _FAIL
     print(f"   📊 Calibration sensors ready: RTD={rtd_status}, pH={ph_status}")
 
     return sensors
@@ -337,24 +382,20 @@ def _run_calibration_loop(display, main_group, labels, sensors):
         {"name": "Complete", "command": None, "instruction": "Calibration finished"},
     ]
 
-    # Button setup
-    next_button = digitalio.DigitalInOut(board.D13)
-    next_button.direction = digitalio.Direction.INPUT
-    next_button.pull = digitalio.Pull.UP
-
-    abort_button = digitalio.DigitalInOut(board.D11)
-    abort_button.direction = digitalio.Direction.INPUT
-    abort_button.pull = digitalio.Pull.UP
+    # Button setup - keypad scans in the background and queues presses,
+    # so none are lost while the loop sleeps between sensor ticks
+    buttons = keypad.Keys((board.D13, board.D11), value_when_pressed=False, pull=True)
 
     # Button state tracking
     last_next_press = 0
     last_abort_press = 0
-    button_debounce = 0.5  # 500ms debounce
+    button_debounce = _BUTTON_DEBOUNCE_MS / 1000
 
     try:
         loop_count = 0
         last_sensor_update = 0
         last_instruction_update = 0
+        last_status_log = 0
 
         # Show initial instruction
         _update_calibration_instruction(labels, calibration_steps[calibration_step])
@@ -363,15 +404,12 @@ def _run_calibration_loop(display, main_group, labels, sensors):
             loop_count += 1
             current_time = time.monotonic()
 
-            # Re-assert display control every 10 loops
-            if loop_count % 10 == 0:
-                display.root_group = main_group
+            event = buttons.events.get()
+            next_pressed = event and event.pressed and event.key_number == _NEXT_KEY
+            abort_pressed = event and event.pressed and event.key_number == _ABORT_KEY
 
             # Check NEXT button (D13)
-            if (
-                not next_button.value
-                and (current_time - last_next_press) > button_debounce
-            ):
+            if next_pressed and (current_time - last_next_press) > button_debounce:
                 last_next_press = current_time
 
                 if calibration_step < len(calibration_steps) - 1:
@@ -392,10 +430,7 @@ def _run_calibration_loop(display, main_group, labels, sensors):
                     return _finish_calibration(sensors, labels)
 
             # Check ABORT button (D11)
-            if (
-                not abort_button.value
-                and (current_time - last_abort_press) > button_debounce
-            ):
+            if abort_pressed and (current_time - last_abort_press) > button_debounce:
                 last_abort_press = current_time
                 return _abort_calibration(sensors, labels)
 
@@ -407,66 +442,93 @@ def _run_calibration_loop(display, main_group, labels, sensors):
                 )
 
             # Update sensor readings every 2 seconds
-            if current_time - last_sensor_update >= 2.0:
+            if current_time - last_sensor_update >= _SENSOR_UPDATE_S:
                 last_sensor_update = current_time
+                ph_ready = sensors.ph_working and sensors.ph_sensor
+                comp_temp = None
+
+                # Start the pH read first - the EZO processes it while we
+                # read the RTD over SPI
+                ph_started = False
+                if ph_ready:
+                    try:
+                        ph_started = sensors.ph_sensor.start_read_ph()
+                    except Exception as e:
+                        print(f"   ⚠️ pH read error: {e}")
 
                 # Temperature reading - SAME method as main system
-                if sensors["rtd_working"] and sensors["rtd_sensor"]:
+                if sensors.rtd_working and sensors.rtd_sensor:
                     try:
-                        temp_c, temp_source = sensors["rtd_sensor"].read_temperature()
+                        temp_c, temp_source = sensors.rtd_sensor.read_temperature()
                         if temp_c is not None:
-                            labels["temp"].text = (
-                                f"Temp: {temp_c:.3f} °C ({temp_source})"
-                            )
-
-                            # Send temperature compensation to pH sensor
-                            if sensors["ph_working"] and sensors["ph_sensor"]:
-                                sensors["ph_sensor"].set_temp_compensation(temp_c)
+                            labels.temp.text = f"Temp: {temp_c:.3f} °C ({temp_source})"
+                            comp_temp = temp_c
                         else:
-                            labels["temp"].text = f"Temp: ERROR ({temp_source})"
+                            labels.temp.text = f"Temp: ERROR ({temp_source})"
                     except Exception as e:
                         print(f"   ⚠️ RTD read error: {e}")
-                        labels["temp"].text = "Temp: RTD ERROR"
+                        labels.temp.text = "Temp: RTD ERROR"
                 else:
-                    labels["temp"].text = "Temp: 39.000 °C (fallback)"
+                    labels.temp.text = "Temp: 39.000 °C (fallback)"
 
                 # pH reading - SAME method as main system
-                if sensors["ph_working"] and sensors["ph_sensor"]:
+                if ph_ready:
                     try:
-                        ph_value = sensors["ph_sensor"].read_ph()
-                        if isinstance(ph_value, (int, float)):
-                            labels["ph"].text = f"pH: {ph_value:.3f}"
-                        else:
-                            labels["ph"].text = f"pH: {ph_value}"
-
-                        # Calibration status - SAME method as main system
-                        cal_status = sensors["ph_sensor"].query("Cal,?")
-                        labels["cal_status"].text = f"Cal Status: {cal_status.strip()}"
+                        if not ph_started:
+                            raise RuntimeError("pH read not started")
+                        ph_value = sensors.ph_sensor.finish_read_ph()
+                        try:
+                            labels.ph.text = f"pH: {ph_value:.3f}"
+                        except (ValueError, TypeError):
+                            # read failed - ph_value is the EZO error message
+                            labels.ph.text = f"pH: {ph_value}"
+
+                        # Send temperature compensation for the next reading
+                        # (skipped while the temperature is unchanged)
+                        last_comp = sensors.last_comp_temp
+                        if comp_temp is not None and (
+                            last_comp is None
+                            or abs(comp_temp - last_comp) * 1000
+                            >= _TEMP_COMP_THRESHOLD_MILLIC
+                        ):
+                            sensors.ph_sensor.set_temp_compensation(comp_temp)
+                            sensors.last_comp_temp = comp_temp
+
+                        # Calibration status only changes on a calibration step
+                        if sensors.cal_status is None:
+                            sensors.cal_status = sensors.ph_sensor.query("Cal,?").strip()
+                        labels.cal_status.text = f"Cal Status: {sensors.cal_status}"
 
                     except Exception as e:
                         print(f"   ⚠️ pH read error: {e}")
-                        labels["ph"].text = "pH: SENSOR ERROR"
-                        labels["cal_status"].text = "Cal Status: ERROR"
+                        labels.ph.text = "pH: SENSOR ERROR"
+                        labels.cal_status.text = "Cal Status: ERROR"
                 else:
-                    labels["ph"].text = "pH: 7.000 (fallback)"
-                    labels["cal_status"].text = "Cal Status: NO SENSOR"
+                    labels.ph.text = "pH: 7.000 (fallback)"
+                    labels.cal_status.text = "Cal Status: NO SENSOR"
 
                 # Status logging every 20 seconds
-                if loop_count % 100 == 0:
-                    rtd_ok = "✅" if sensors["rtd_working"] else "❌"
-                    ph_ok = "✅" if sensors["ph_working"] else "❌"
-                    print(
-                        f"   📊 Calibration Loop {loop_count}: RTD={rtd_ok}, pH={ph_ok}"
-                    )
-
-            time.sleep(0.1)  # 100ms loop
+                if _DEBUG and current_time - last_status_log >= 20.0:
+                    last_status_log = current_time
+                    rtd_ok = _OK if sensors.rtd_working else _FAIL
+                    ph_ok = _OK if sensors.ph_working else _FAIL
+                    print(f"   Calibration Loop {loop_count}: RTD={rtd_ok}, pH={ph_ok}")
+
+            # Sleep until the next scheduled update (max 500ms); queued
+            # button events are handled without sleeping
+            if not buttons.events:
+                next_deadline = min(
+                    last_sensor_update + _SENSOR_UPDATE_S,
+                    last_instruction_update + 5.0,
+                )
+                time.sleep(max(0.01, min(0.5, next_deadline - time.monotonic())))
 
     except KeyboardInterrupt:
         print("   🛑 Calibration interrupted")
-        return _cleanup_and_exit()
     except Exception as e:
         print(f"   ❌ Calibration loop error: {e}")
-        return _cleanup_and_exit()
+
+    return _cleanup_and_exit()
 
 
 def _update_calibration_instruction(labels, step_info):
@@ -475,40 +537,41 @@ def _update_calibration_instruction(labels, step_info):
     instruction = step_info["instruction"]
 
     # Update instruction labels
-    labels["temp"].text = f"STEP: {step_name}"
+    labels.temp.text = f"STEP: {step_name}"
     if "Complete" in step_name:
-        labels["ph"].text = "🎉 Press NEXT to finish"
+        labels.ph.text = "🎉 Press NEXT to finish"
     else:
-        labels["ph"].text = f"📍 {instruction}"
+        labels.ph.text = f"📍 {instruction}"
 
 
 def _perform_calibration_step(sensors, step_info, labels):
     """Perform a calibration step with the pH sensor"""
-    if not sensors["ph_working"] or not sensors["ph_sensor"]:
-        labels["cal_status"].text = "❌ pH sensor not available"
+    if not sensors.ph_working or not sensors.ph_sensor:
+        labels.cal_status.text = "❌ pH sensor not available"
         return False
 
     step_name = step_info["name"]
     command = step_info["command"]
 
     print(f"🧪 Performing calibration step: {step_name}")
-    labels["cal_status"].text = f"⏳ Calibrating {step_name}..."
+    labels.cal_status.text = f"⏳ Calibrating {step_name}..."
 
     try:
         # Send calibration command to EZO
-        sensors["ph_sensor"].send_command(command)
-        time.sleep(1.6)  # EZO processing time
+        sensors.ph_sensor.send_command(command)
+        time.sleep(_EZO_PROCESSING_MS / 1000)
 
         # Query calibration status
-        cal_status = sensors["ph_sensor"].query("Cal,?")
-        labels["cal_status"].text = f"✅ {step_name}: {cal_status.strip()}"
+        cal_status = sensors.ph_sensor.query("Cal,?")
+        sensors.cal_status = cal_status.strip()
+        labels.cal_status.text = f"✅ {step_name}: {cal_status.strip()}"
 
         print(f"   ✅ {step_name} complete: {cal_status.strip()}")
         return True
 
     except Exception as e:
         print(f"   ❌ Calibration step failed: {e}")
-        labels["cal_status"].text = f"❌ {step_name} failed"
+        labels.cal_status.text = f"❌ {step_name} failed"
         return False
 
 
@@ -517,18 +580,18 @@ def _finish_calibration(sensors, labels):
     print("🎉 CALIBRATION SEQUENCE COMPLETE!")
 
     # Get final calibration status
-    if sensors["ph_working"] and sensors["ph_sensor"]:
+    if sensors.ph_working and sensors.ph_sensor:
         try:
-            final_status = sensors["ph_sensor"].query("Cal,?")
+            final_status = sensors.ph_sensor.query("Cal,?")
             print(f"   📊 Final calibration status: {final_status.strip()}")
-            labels["cal_status"].text = f"🎉 DONE: {final_status.strip()}"
+            labels.cal_status.text = f"🎉 DONE: {final_status.strip()}"
         except Exception as e:
             print(f"   ⚠️ Could not read final status: {e}")
-            labels["cal_status"].text = "🎉 Calibration complete"
+            labels.cal_status.text = "🎉 Calibration complete"
 
     # Show completion message
-    labels["ph"].text = "🎉 Calibration finished!"
-    labels["temp"].text = "System will restart..."
+    labels.ph.text = "🎉 Calibration finished!"
+    labels.temp.text = "System will restart..."
 
     # Give user time to read message
     print("   💡 Displaying completion message for 5 seconds...")
@@ -545,23 +608,23 @@ def _abort_calibration(sensors, labels):
     print("🗑️ CALIBRATION ABORTED!")
 
     # Clear EZO calibration data
-    if sensors["ph_working"] and sensors["ph_sensor"]:
+    if sensors.ph_working and sensors.ph_sensor:
         try:
             print("   🧹 Clearing EZO calibration data...")
-            sensors["ph_sensor"].send_command("Cal,clear")
-            time.sleep(1.6)  # EZO processing time
+            sensors.ph_sensor.send_command("Cal,clear")
+            time.sleep(_EZO_PROCESSING_MS / 1000)
 
             # Verify clearing
-            cal_status = sensors["ph_sensor"].query("Cal,?")
+            cal_status = sensors.ph_sensor.query("Cal,?")
             print(f"   ✅ EZO cleared: {cal_status.strip()}")
-            labels["cal_status"].text = f"🗑️ CLEARED: {cal_status.strip()}"
+            labels.cal_status.text = f"🗑️ CLEARED: {cal_status.strip()}"
         except Exception as e:
             print(f"   ⚠️ Could not clear EZO: {e}")
-            labels["cal_status"].text = "⚠️ Clear command failed"
+            labels.cal_status.text = "⚠️ Clear command failed"
 
     # Show abort message
-    labels["ph"].text = "🗑️ Calibration aborted"
-    labels["temp"].text = "System will restart..."
+    labels.ph.text = "🗑️ Calibration aborted"
+    labels.temp.text = "System will restart..."
 
     # Give user time to read message
     print("   💡 Displaying abort message for 3 seconds...")
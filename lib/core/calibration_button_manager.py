@@ -4,9 +4,25 @@ Calibration Button Manager Module
 Handles calibration button detection and mode triggering
 Stage 1: Button setup and detection testing only
 """
-import time
 import board
-import digitalio
+import keypad
+
+# keypad.Keys key numbers
+NEXT_KEY = 0  # D11
+ABORT_KEY = 1  # D13
+
+# keypad event timestamps are supervisor.ticks_ms() values, which wrap
+_TICKS_PERIOD = 1 << 29
+
+# Static messages for check_buttons() (no per-call string building)
+_MSG_NEXT_DOWN = "🔘 NEXT button pressed"
+_MSG_ABORT_DOWN = "🔘 ABORT button pressed"
+_MSG_BOTH_DOWN = "🔘🔘 BOTH buttons pressed together!"
+_MSG_TRIGGER = "   🎯 CALIBRATION MODE TRIGGER!"
+_MSG_TRIGGER_NOTE = "   📊 This would start calibration mode now..."
+_MSG_TOO_SHORT = "   ⚠️ Both buttons released too soon"
+_MSG_NEXT_UP = "   ✅ NEXT button released"
+_MSG_ABORT_UP = "   ✅ ABORT button released"
 
 
 class CalibrationButtonManager:
@@ -18,24 +34,23 @@ class CalibrationButtonManager:
     def __init__(self, state_manager=None):
         self.state_manager = state_manager
 
-        # Button setup
-        self.next_button = None
-        self.abort_button = None
+        # Button setup - keypad.Keys scans and debounces in the background
+        self.keys = None
+        self._events = None
 
         # State tracking
         self.buttons_initialized = False
         self.calibration_mode_active = False
-        self.last_button_check = 0
-        self.button_check_interval = 0.1  # Check buttons every 100ms
-
-        # Button press tracking (for debouncing)
-        self.next_pressed = False
-        self.abort_pressed = False
-        self.both_pressed = False
-        self.last_next_state = True  # True = not pressed (pull-up)
-        self.last_abort_state = True
-        self.press_start_time = 0
-        self.min_press_duration = 0.2  # Minimum press duration for detection
+        self.verbose = False  # Print button events (USB serial writes block)
+
+        # Button press tracking: bit0 = NEXT down, bit1 = ABORT down
+        self._down = 0
+        self._both_start = 0  # Event timestamp (ms) when both went down
+
+        # Debounce (contact bounce, handled by keypad) is separate from the
+        # UX hold time required to enter calibration mode
+        self._debounce = 0.020
+        self.min_press_duration = 0.2  # Both buttons held this long to trigger
 
         # Statistics
         self.next_press_count = 0
@@ -47,19 +62,16 @@ class CalibrationButtonManager:
         try:
             print("🔘 Initializing calibration buttons...")
 
-            # Setup NEXT button (D11)
-            self.next_button = digitalio.DigitalInOut(board.D11)
-            self.next_button.direction = digitalio.Direction.INPUT
-            self.next_button.pull = digitalio.Pull.UP  # Normally HIGH, press = LOW
-
-            # Setup ABORT button (D13)
-            self.abort_button = digitalio.DigitalInOut(board.D13)
-            self.abort_button.direction = digitalio.Direction.INPUT
-            self.abort_button.pull = digitalio.Pull.UP  # Normally HIGH, press = LOW
-
-            # Initialize state tracking
-            self.last_next_state = self.next_button.value
-            self.last_abort_state = self.abort_button.value
+            # NEXT (D11) and ABORT (D13): normally HIGH, press = LOW
+            self.keys = keypad.Keys(
+                (board.D11, board.D13),
+                value_when_pressed=False,
+                pull=True,
+                interval=self._debounce,
+                max_events=8,
+            )
+            self._events = self.keys.events
+            self._down = 0
 
             self.buttons_initialized = True
             print("   ✅ Calibration buttons initialized:")
@@ -91,127 +103,82 @@ class CalibrationButtonManager:
         Check button states (non-blocking)
         Call this from main loop every cycle
         """
-        current_time = time.monotonic()
-
-        # Rate limit button checking
-        if current_time - self.last_button_check < self.button_check_interval:
+        # Idle fast path: no queued transitions means nothing changed.
+        # _events is only set once initialization has succeeded.
+        events = self._events
+        if events is None:
             return False
-
-        self.last_button_check = current_time
-
-        if not self.buttons_initialized:
+        event = events.get()
+        if event is None:
             return False
 
-        try:
-            # Read current button states
-            next_current = self.next_button.value
-            abort_current = self.abort_button.value
-
-            # Detect button press changes (with debouncing)
-            next_pressed_now = not next_current  # Invert because pull-up
-            abort_pressed_now = not abort_current
-
-            # NEXT button press detection
-            if next_pressed_now and not self.next_pressed:
-                # Button just pressed
-                self.next_pressed = True
-                self.press_start_time = current_time
-                print("🔘 NEXT button pressed")
-
-            elif not next_pressed_now and self.next_pressed:
-                # Button just released
-                press_duration = current_time - self.press_start_time
-                if press_duration >= self.min_press_duration:
-                    self.next_press_count += 1
-                    print(
-                        f"   ✅ NEXT button released (duration: {press_duration:.2f}s)"
-                    )
-                else:
-                    print(
-                        f"   ⚠️ NEXT button too short (duration: {press_duration:.2f}s)"
-                    )
-                self.next_pressed = False
-
-            # ABORT button press detection
-            if abort_pressed_now and not self.abort_pressed:
-                # Button just pressed
-                self.abort_pressed = True
-                self.press_start_time = current_time
-                print("🔘 ABORT button pressed")
-
-            elif not abort_pressed_now and self.abort_pressed:
-                # Button just released
-                press_duration = current_time - self.press_start_time
-                if press_duration >= self.min_press_duration:
-                    self.abort_press_count += 1
-                    print(
-                        f"   ✅ ABORT button released (duration: {press_duration:.2f}s)"
-                    )
-                else:
-                    print(
-                        f"   ⚠️ ABORT button too short (duration: {press_duration:.2f}s)"
-                    )
-                self.abort_pressed = False
-
-            # Both buttons pressed together detection
-            both_pressed_now = next_pressed_now and abort_pressed_now
-
-            if both_pressed_now and not self.both_pressed:
-                # Both buttons just pressed together
-                self.both_pressed = True
-                self.press_start_time = current_time
-                print("🔘🔘 BOTH buttons pressed together!")
-
-            elif not both_pressed_now and self.both_pressed:
-                # At least one button released
-                press_duration = current_time - self.press_start_time
-                if press_duration >= self.min_press_duration:
+        # Edge detection on the 2-bit mask: new presses = cur & ~last
+        last = self._down
+        bit = 1 << event.key_number
+        cur = last | bit if event.pressed else last & ~bit
+        self._down = cur
+        pressed = cur & ~last
+        released = last & ~cur
+
+        verbose = self.verbose
+
+        if pressed and cur == 3:
+            self._both_start = event.timestamp
+        if verbose and pressed:
+            if pressed & 1:
+                print(_MSG_NEXT_DOWN)
+            if pressed & 2:
+                print(_MSG_ABORT_DOWN)
+            if cur == 3:
+                print(_MSG_BOTH_DOWN)
+
+        if released:
+            if last == 3:
+                # First release after both were held together
+                held = (event.timestamp - self._both_start) % _TICKS_PERIOD
+                if held >= self.min_press_duration * 1000:
                     self.calibration_trigger_count += 1
-                    print(
-                        f"   🎯 CALIBRATION MODE TRIGGER! (duration: {press_duration:.2f}s)"
-                    )
-                    print(f"   📊 This would start calibration mode now...")
+                    if verbose:
+                        print(_MSG_TRIGGER, f"(held: {held / 1000:.2f}s)")
+                        print(_MSG_TRIGGER_NOTE)
 
                     # This is where we'll trigger actual calibration later
                     return "calibration_trigger"
-                else:
-                    print(
-                        f"   ⚠️ Both buttons too short (duration: {press_duration:.2f}s)"
-                    )
-                self.both_pressed = False
-
-            # Update health status
-            if self.state_manager:
-                self.state_manager.update_component_health(
-                    "calibration_buttons", "healthy"
-                )
-
-            return False  # No calibration trigger
-
-        except Exception as e:
-            print(f"   ❌ Button check error: {e}")
-            if self.state_manager:
-                self.state_manager.update_component_health(
-                    "calibration_buttons", "degraded", str(e)
-                )
-            return False
+                if verbose:
+                    print(_MSG_TOO_SHORT, f"(held: {held / 1000:.2f}s)")
+
+            if released & 1:
+                self.next_press_count += 1
+                if verbose:
+                    print(_MSG_NEXT_UP)
+            if released & 2:
+                self.abort_press_count += 1
+                if verbose:
+                    print(_MSG_ABORT_UP)
+
+        # Update health status
+        if self.state_manager:
+            self.state_manager.update_component_health(
+                "calibration_buttons", "healthy"
+            )
+
+        return False  # No calibration trigger
 
     def get_button_states(self):
         """Get current button states for debugging"""
         if not self.buttons_initialized:
             return None
 
-        try:
-            return {
-                "next_raw": self.next_button.value,
-                "abort_raw": self.abort_button.value,
-                "next_pressed": not self.next_button.value,  # Invert for pull-up
-                "abort_pressed": not self.abort_button.value,
-                "both_pressed": (not self.next_button.value)
-                and (not self.abort_button.value),
-            }
-        except:
-            return None
+        # Single snapshot so all fields describe the same instant
+        n = bool(self._down & 1)
+        a = bool(self._down & 2)
+        return {
+            "next_raw": not n,  # Raw pin level (pull-up)
+            "abort_raw": not a,
+            "next_pressed": n,
+            "abort_pressed": a,
+            "both_pressed": n and a,
+        }
 
     def get_statistics(self):
         """Get button press statistics"""
@@ -221,11 +188,7 @@ class CalibrationButtonManager:
             "abort_press_count": self.abort_press_count,
             "calibration_triggers": self.calibration_trigger_count,
             "calibration_mode_active": self.calibration_mode_active,
-            "last_check_age": (
-                time.monotonic() - self.last_button_check
-                if self.last_button_check
-                else None
-            ),
+            "queued_events": len(self._events) if self._events is not None else 0,
         }
 
     def reset_statistics(self):
@@ -238,10 +201,9 @@ class CalibrationButtonManager:
     def cleanup(self):
         """Clean up button resources"""
         try:
-            if self.next_button:
-                self.next_button.deinit()
-            if self.abort_button:
-                self.abort_button.deinit()
+            self._events = None
+            if self.keys:
+                self.keys.deinit()
             print("🔘 Calibration buttons cleaned up")
         except Exception as e:
             print(f"   ⚠️ Button cleanup error: {e}")
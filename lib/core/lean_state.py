@@ -4,6 +4,22 @@ Minimal State Manager for ESP32-S3
 CircuitPython compatible - no typing imports
 """
 import time
+from collections import deque
+
+# Lookup tables shared by all StateManager calls
+_H_HEALTHY = "healthy"
+_H_DEGRADED = "degraded"
+_HEALTH_NAMES = ("OK", "WARN", "FAIL")
+_STATE_NAMES = ("STARTING", "HEALTHY", "DEGRADED", "CRITICAL")
+
+
+def _health_level(health):
+    """Stored level for a health string (0=healthy, 1=degraded, 2=failed)"""
+    if health == _H_HEALTHY:
+        return 0
+    if health == _H_DEGRADED:
+        return 1
+    return 2
 
 class SystemState:
     """Simplified system states"""
@@ -21,7 +37,7 @@ class StateManager:
         
         # Minimal component tracking
         self.components = {}  # name -> health_level (0=healthy, 1=degraded, 2=failed)
-        self.alerts = []      # Keep only last 5 alerts
+        self.alerts = deque((), 5)  # Keep only last 5 alerts
         self.readings = {}    # Latest sensor readings only
         
         # Hot tub safety thresholds
@@ -31,20 +47,28 @@ class StateManager:
     def register_component(self, name):
         """Register a component"""
         self.components[name] = 2  # Start as unknown/failed
+
+    def register_components(self, names):
+        """Register several components in one dict update"""
+        self.components.update(dict.fromkeys(names, 2))
     
     def update_component_health(self, name, health, error=None):
         """Update component health with string values"""
-        health_map = {"healthy": 0, "degraded": 1, "failed": 2}
-        old_health = self.components.get(name, 2)
-        self.components[name] = health_map.get(health, 2)
+        new = _health_level(health)
+        old_health = self.components.get(name)  # None if first report
+        self.components[name] = new
         
-        if error and health != "healthy":
+        if error and new != 0:
             self.add_alert(f"{name}: {error}")
         
         # Update system state if health changed
-        if old_health != self.components[name]:
+        if old_health != new:
             self._update_system_state()
     
+    def component_is(self, name, health):
+        """Check a component's current health against a string value"""
+        return self.components.get(name) == _health_level(health)
+    
     def update_reading(self, sensor, value, timestamp=None):
         """Store latest sensor reading"""
         if timestamp is None:
@@ -61,8 +85,12 @@ class StateManager:
     
     def _update_system_state(self):
         """Update overall system state"""
-        failed = sum(1 for h in self.components.values() if h == 2)
-        degraded = sum(1 for h in self.components.values() if h == 1)
+        failed = degraded = 0
+        for h in self.components.values():
+            if h == 2:
+                failed += 1
+            elif h == 1:
+                degraded += 1
         
         if "temperature" in self.components and self.components["temperature"] == 2:
             self.state = SystemState.CRITICAL  # No temperature = safety risk
@@ -76,11 +104,7 @@ class StateManager:
     def add_alert(self, message, severity="warning"):
         """Add alert with memory management"""
         alert = {"msg": message, "sev": severity, "time": time.monotonic()}
-        self.alerts.append(alert)
-        
-        # Keep only last 5 alerts to save memory
-        if len(self.alerts) > 5:
-            self.alerts.pop(0)
+        self.alerts.append(alert)  # maxlen drops the oldest
         
         print(f"ALERT: {message}")
     
@@ -107,15 +131,14 @@ class StateManager:
     
     def get_status(self):
         """Get minimal status summary"""
-        state_names = ["STARTING", "HEALTHY", "DEGRADED", "CRITICAL"]
         temp_reading = self.get_reading("temperature", 120)
         temp_safe = True
         if temp_reading:
             temp_safe = temp_reading < self.temp_critical
         
         return {
-            "state": state_names[self.state],
-            "components": {name: ["OK", "WARN", "FAIL"][health] 
+            "state": _STATE_NAMES[self.state],
+            "components": {name: _HEALTH_NAMES[health] 
                           for name, health in self.components.items()},
             "alerts": len(self.alerts),
             "temp_safe": temp_safe
@@ -6,6 +6,28 @@ Extracted from main code.py for better organization
 """
 import time
 
+# Status colors
+_RED = (255, 0, 0)
+_GREEN = (0, 255, 0)
+_OFF = (0, 0, 0)
+
+_LEGEND = (
+    "\n💡 Simple NeoPixel Status Legend:\n"
+    "   🟢 GREEN: All systems OK\n"
+    "   🔴 RED: System has problems\n"
+)
+
+_PROBLEM_STATES = ("CRITICAL", "FAILED")
+
+
+def _show(pixel, color):
+    """Write color only if the pixel isn't already showing it"""
+    # pixelbuf keeps the pre-brightness values, so this read is a RAM
+    # lookup and stays correct when other code (WiFi, calibration) has
+    # changed the pixel since our last write
+    if pixel[0] != color:
+        pixel[0] = color
+
 
 def update_neopixel_status(pixel, wifi_manager, mqtt_manager, state_manager):
     """Simple NeoPixel status: Green = OK, Red = Problem"""
@@ -18,35 +40,27 @@ def update_neopixel_status(pixel, wifi_manager, mqtt_manager, state_manager):
         # Red if any critical issues
         if (not wifi_connected or 
             not mqtt_connected or 
-            system_status.get("state") in ["CRITICAL", "FAILED"]):
-            pixel[0] = (255, 0, 0)  # Red
+            system_status.get("state") in _PROBLEM_STATES):
+            _show(pixel, _RED)
             return "PROBLEM"
         else:
-            pixel[0] = (0, 255, 0)  # Green
+            _show(pixel, _GREEN)
             return "OK"
             
     except Exception as e:
-        pixel[0] = (255, 0, 0)  # Red for any errors
+        _show(pixel, _RED)  # Red for any errors
         return "ERROR"
 
 
 def print_neopixel_legend():
     """Print the simple NeoPixel status legend"""
-    print("\n💡 Simple NeoPixel Status Legend:")
-    print("   🟢 GREEN: All systems OK")
-    print("   🔴 RED: System has problems")
-    print()
+    print(_LEGEND)
 
 
 def neopixel_diagnostic_test(pixel, watchdog_enabled, wdt):
     """Test NeoPixel colors"""
     print("🔍 Simple NeoPixel diagnostic test...")
-    colors = [
-        ((255, 0, 0), "RED - Problem"),
-        ((0, 255, 0), "GREEN - OK"),
-    ]
-
-    for color, description in colors:
+    for color, description in ((_RED, "RED - Problem"), (_GREEN, "GREEN - OK")):
         print(f"   Testing: {description}")
         pixel[0] = color
         time.sleep(1)
@@ -54,5 +68,5 @@ def neopixel_diagnostic_test(pixel, watchdog_enabled, wdt):
         if watchdog_enabled:
             wdt.feed()
 
-    pixel[0] = (0, 0, 0)  # Turn off
+    pixel[0] = _OFF  # Turn off
     print("   Diagnostic complete!")
\ No newline at end of file
@@ -1,3 +1,34 @@
+import time
+
+# Calibration buffers in order: (EZO label, expected pH)
+_CAL_POINTS = (("mid", 7.000), ("low", 4.000), ("high", 10.000))
+
+# EZO calibration-level query
+_CAL_QUERY = "Cal,?"
+
+# Status LED flash colors
+_FLASH_ON = (0, 128, 0)
+_FLASH_OFF = (0, 0, 0)
+
+# run_calibration() schedule in 50 ms ticks
+_TICK_S = 0.05
+_FLASH_TICKS = 10  # 0.5 s
+_PH_TICKS = 20  # 1 s
+_TEMP_TICKS = 40  # 2 s
+_ABORT_HOLD_TICKS = 20  # 1 s
+
+
+def _wait_for_release(button_next, button_abort, watchdog=None):
+    """Block until both buttons are released (returns at once if they are)"""
+    # Buttons are pulled up: value True means released
+    if button_next.value and button_abort.value:
+        return
+    while not (button_next.value and button_abort.value):
+        if watchdog is not None:
+            watchdog.feed()
+        time.sleep(0.05)
+
+
 def calibration_preview(
     ph_label,
     temp_c_label,
@@ -7,14 +38,11 @@ def calibration_preview(
     button_next,
     button_abort,
     pixel,
+    watchdog=None,
 ):
-    import time
-
     next_was_pressed = False
     abort_was_pressed = False
 
-    calibration_points = [("mid", 7.000), ("low", 4.000), ("high", 10.000)]
-
     step = 0
     done = False
 
@@ -22,16 +50,16 @@ def calibration_preview(
     print("Press NEXT (D6) to step forward, ABORT (D9) to exit.\n")
 
     # Wait for release
-    while not button_next.value or not button_abort.value:
-        if watchdog is not None:
-            watchdog.feed()
-        time.sleep(0.01)
+    _wait_for_release(button_next, button_abort, watchdog)
 
     led_on = False
     last_flash = time.monotonic()
 
+    # Bind hot-loop lookups to locals
+    mono = time.monotonic
+
     while not done:
-        buffer_label, pH_value = calibration_points[step]
+        buffer_label, pH_value = _CAL_POINTS[step]
         ph_label.text = f"pH {pH_value:.3f} ({buffer_label})"
         temp_c_label.text = f"Step {step+1}/3: NEXT"
         temp_f_label.text = "Press NEXT to step or ABORT to exit"
@@ -39,45 +67,48 @@ def calibration_preview(
         time_label.text = ""
 
         while True:
-            now = time.monotonic()
+            now = mono()
 
             if now - last_flash >= 0.5:
                 led_on = not led_on
-                pixel[0] = (0, 128, 0) if led_on else (0, 0, 0)
+                pixel[0] = _FLASH_ON if led_on else _FLASH_OFF
                 last_flash = now
 
-            if not button_abort.value and not abort_was_pressed:
+            # One consistent snapshot of both buttons per pass
+            next_down = not button_next.value
+            abort_down = not button_abort.value
+
+            if abort_down and not abort_was_pressed:
                 print("❌ Preview aborted.")
                 done = True
                 break
-            elif button_abort.value:
+            elif not abort_down:
                 # Reset the abort press state once released
                 abort_was_pressed = False
 
             # Wait until NEXT is released before allowing calibration
-            if not button_next.value and not next_was_pressed:
+            if next_down and not next_was_pressed:
                 next_was_pressed = True
                 press_start = now
-            elif button_next.value and next_was_pressed:
+            elif not next_down and next_was_pressed:
                 next_was_pressed = False
                 press_duration = now - press_start
                 if press_duration > 0.1:
                     ph_label.text = "Calibrating..."
                     temp_c_label.text = "Waiting..."
                     rssi_label.text = "Hold still..."
-                    print(f"⚙️ Calibrating '{label}' at pH {expected_ph:.3f}...")
+                    print(f"⚙️ Calibrating '{buffer_label}' at pH {pH_value:.3f}...")
 
-                    print(f"👉 Sending: Cal,{label},{expected_ph:.2f}")
-                    command = f"Cal,{label},{expected_ph:.2f}"
+                    print(f"👉 Sending: Cal,{buffer_label},{pH_value:.2f}")
                 next_was_pressed = False
-                step = (step + 1) % len(calibration_points)
+                step = (step + 1) % len(_CAL_POINTS)
                 break
 
             if watchdog is not None:
                 watchdog.feed()
-                time.sleep(0.05)
+            time.sleep(0.05)
 
-    pixel[0] = (0, 0, 0)
+    pixel[0] = _FLASH_OFF
     ph_label.text = "--"
     temp_c_label.text = "Temp C"
     temp_f_label.text = "Temp F"
@@ -98,8 +129,6 @@ def run_calibration(
     pixel,
     watchdog=None,
 ):
-    import time
-
     temp_f_label.text = ""
     rssi_label.text = ""
     time_label.text = ""
@@ -107,77 +136,80 @@ def run_calibration(
     next_was_pressed = False
     abort_was_pressed = False
 
-    calibration_points = [("mid", 7.000), ("low", 4.000), ("high", 10.000)]
-
     print("\n--- PH CALIBRATION MODE ---")
     print("Use NEXT (D6) to calibrate once stable.")
     print("Press ABORT (D9) to cancel.\n")
 
-    while not button_next.value or not button_abort.value:
-        time.sleep(0.01)
+    _wait_for_release(button_next, button_abort, watchdog)
 
     led_on = False
-    last_flash = time.monotonic()
     step = 0
     aborted = False
 
-    while step < len(calibration_points):
+    # Bind hot-loop lookups to locals
+    mono = time.monotonic
+    wf = watchdog.feed if watchdog is not None else None
+    ph_read = ph_sensor.read_ph
+
+    while step < len(_CAL_POINTS):
         ph_label.text = f"Step {step+1} active"
         temp_f_label.text = "Press NEXT to calibrate"
         rssi_label.text = ""
-        label, expected_ph = calibration_points[step]
+        label, expected_ph = _CAL_POINTS[step]
         print(f"\nPlace probe in pH {expected_ph:.3f} buffer ({label})")
 
+        # Per-step text, built once rather than on every pH refresh
+        label_suffix = f" ({label})"
+        step_text = f"Step {step+1}/3"
+
         press_start = None
-        last_temp_update = 0
-        last_ph_update = 0
+        tick = 0
+        next_tick = mono()
 
         while True:
-            now = time.monotonic()
-
-            if now - last_flash >= 0.5:
+            if tick % _FLASH_TICKS == 0:
                 led_on = not led_on
-                pixel[0] = (0, 128, 0) if led_on else (0, 0, 0)
-                last_flash = now
+                pixel[0] = _FLASH_ON if led_on else _FLASH_OFF
 
-            if watchdog is not None:
-                watchdog.feed()
+            if wf is not None:
+                wf()
 
-            if now - last_temp_update >= 2.0:
+            if tick % _TEMP_TICKS == 0:
                 temp_c = read_temperature()
                 if temp_c is not None:
                     ph_sensor.set_temp_compensation(temp_c)
                     print(f"🌡️ Temp compensation: {temp_c:.2f} °C")
-                last_temp_update = now
 
-            if now - last_ph_update >= 1.0:
-                current_ph = ph_sensor.read_ph()
-                ph_label.text = f"pH {current_ph:.3f} ({label})"
-                temp_c_label.text = f"Step {step+1}/3"
+            if tick % _PH_TICKS == 0:
+                current_ph = ph_read()
+                ph_label.text = f"pH {current_ph:.3f}{label_suffix}"
+                temp_c_label.text = step_text
                 if ph_label.text != "Calibrating...":
                     temp_f_label.text = ""
                     rssi_label.text = ""
                 time_label.text = ""
-                last_ph_update = now
                 print(f"📖 Live pH: {current_ph:.3f}")
 
-            if not button_abort.value and not abort_was_pressed:
-                abort_was_pressed = True
-                abort_press_start = now
-            elif not button_abort.value and abort_was_pressed:
-                if now - abort_press_start > 1.0:
-                    print("❌ Calibration aborted.")
-                    ph_label.text = "❌ Aborted"
-                    aborted = True
-                    break
-            elif button_abort.value:
-                abort_was_pressed = False
+            # One consistent snapshot of both buttons per pass
+            next_down = not button_next.value
+            abort_down = not button_abort.value
+
+            # ABORT must be held for over a second
+            if not abort_down:
                 abort_was_pressed = False
+            elif not abort_was_pressed:
+                abort_was_pressed = True
+                abort_press_tick = tick
+            elif tick - abort_press_tick > _ABORT_HOLD_TICKS:
+                print("❌ Calibration aborted.")
+                ph_label.text = "❌ Aborted"
+                aborted = True
+                break
 
-            if not button_next.value and not next_was_pressed:
+            if next_down and not next_was_pressed:
                 next_was_pressed = True
                 time.sleep(0.1)
-            elif button_next.value and next_was_pressed:
+            elif not next_down and next_was_pressed:
                 next_was_pressed = False
 
                 ph_label.text = "Calibrating..."
@@ -185,28 +217,27 @@ def run_calibration(
                 rssi_label.text = "Hold still..."
                 print(f"⚙️ Calibrating '{label}' at pH {expected_ph:.3f}...")
 
-                print(f"👉 Sending: Cal,{label},{expected_ph:.2f}")
                 command = f"Cal,{label},{expected_ph:.2f}"
                 print(f"👉 Sending: {command}")
                 try:
                     # Read current calibration level BEFORE
-                    pre_status = ph_sensor.query("Cal,?").strip()
+                    pre_status = ph_sensor.query(_CAL_QUERY).strip()
                     pre_level = (
                         int(pre_status.split(",")[1]) if "," in pre_status else 0
                     )
 
                     ph_sensor.write(command)
                     for _ in range(25):  # 5 seconds in 0.2s steps
-                        if watchdog is not None:
-                            watchdog.feed()
+                        if wf is not None:
+                            wf()
                         time.sleep(0.2)
 
                     result = None
-                    query_start = time.monotonic()
+                    query_start = mono()
                     new_level = pre_level  # Default in case no update
-                    while time.monotonic() - query_start < 5.0:
+                    while mono() - query_start < 5.0:
                         try:
-                            result = ph_sensor.query("Cal,?").strip()
+                            result = ph_sensor.query(_CAL_QUERY).strip()
                             # Raw response suppressed (was: Resp: '?Cal,n')
                             new_level = (
                                 int(result.split(",")[1])
@@ -219,8 +250,8 @@ def run_calibration(
                             print("Query error:", e)
                             result = ""
                             break
-                        if watchdog is not None:
-                            watchdog.feed()
+                        if wf is not None:
+                            wf()
                         time.sleep(0.25)
                     if result is None:
                         result = ""
@@ -245,39 +276,43 @@ def run_calibration(
                 # Wait for user to press NEXT to move on
                 rssi_label.text = "✅ Press NEXT to continue"
 
-                # Wait for NEXT button release first
-                while not button_next.value:
-                    if watchdog is not None:
-                        watchdog.feed()
-                    if not button_abort.value:
-                        print("❌ Aborted after calibration")
-                        aborted = True
-                        break
-                    time.sleep(0.05)
-
-                # Then wait for a new NEXT press
-                while button_next.value:
-                    if watchdog is not None:
-                        watchdog.feed()
-                    time.sleep(0.05)
-
-                while not button_next.value:
+                # Edge detector: NEXT must be released (from the press
+                # that started calibration), pressed again, then released
+                armed = False
+                pressed = False
+                while True:
+                    if wf is not None:
+                        wf()
                     if not button_abort.value:
                         print("❌ Aborted after calibration")
                         aborted = True
                         break
-                    time.sleep(0.05)
+                    if button_next.value:
+                        if pressed:
+                            break
+                        armed = True
+                    elif armed:
+                        pressed = True
+                    time.sleep(0.02)
 
                 if not aborted:
                     step += 1
                     break
 
-            time.sleep(0.05)
+            # Fixed-rate tick; catch up after short blocking reads so the
+            # tick counts track real time, resync after long ones
+            next_tick += _TICK_S
+            delay = next_tick - mono()
+            if delay > 0:
+                time.sleep(delay)
+            elif delay < -1.0:
+                next_tick -= delay
+            tick += 1
 
         if aborted:
             break
 
-    pixel[0] = (0, 0, 0)
+    pixel[0] = _FLASH_OFF
 
     if not aborted:
         ph_label.text = "🎉 Calibration finished"
@@ -286,7 +321,7 @@ def run_calibration(
         temp_c_label.text = ""
 
         # Show Cal,? response
-        status = ph_sensor.query("Cal,?")
+        status = ph_sensor.query(_CAL_QUERY)
         print(f"📊 Final calibration status: {status.strip()}")
         rssi_label.text = f"Cal: {status.strip()}"
     else:
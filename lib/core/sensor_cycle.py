@@ -4,6 +4,104 @@ Sensor Cycle Module
 Handles main sensor reading cycle with robust measurements
 Extracted from main code.py for better organization
 """
+import gc
+from lib.core.neopixel_status import update_neopixel_status
+from lib.oled_display.oled_display import (
+    update_display,
+    label_text,
+    PH_TEXT,
+    TEMP_C_TEXT,
+    TEMP_F_TEXT,
+    RSSI_TEXT,
+)
+from lib.networking.robust_mqtt import FEED_PH, FEED_TEMPERATURE, FEED_RSSI
+
+# Serial log icons: emoji for development, short ASCII otherwise (fewer
+# bytes over the USB serial console each cycle)
+DEBUG_UI = False
+ICONS = (
+    {
+        "stats": "📊",
+        "error": "❌",
+        "ph": "🧪",
+        "wifi": "📶",
+        "red": "🔴",
+        "green": "🟢",
+        "display": "🖥️",
+        "queue": "📦",
+        "send": "📤",
+        "hint": "💡",
+        "sig_excellent": "🟢",
+        "sig_good": "🟡",
+        "sig_fair": "🟠",
+        "sig_poor": "🔴",
+        "pm": "±",
+        "deg_c": "°C",
+    }
+    if DEBUG_UI
+    else {
+        "stats": "*",
+        "error": "!",
+        "ph": "pH",
+        "wifi": "W",
+        "red": "R",
+        "green": "G",
+        "display": "D",
+        "queue": "Q",
+        "send": ">",
+        "hint": "?",
+        "sig_excellent": "-",
+        "sig_good": "-",
+        "sig_fair": "-",
+        "sig_poor": "-",
+        "pm": "+/-",
+        "deg_c": "C",
+    }
+)
+
+# Component health values and component names
+HEALTHY, DEGRADED, FAILED = "healthy", "degraded", "failed"
+TEMP, PH, WIFI, DISPLAY = "temperature", "ph", "wifi", "display"
+
+# WiFi signal classes: (min RSSI dBm, quality, icon, component health)
+RSSI_TABLE = (
+    (-50, "Excellent", ICONS["sig_excellent"], HEALTHY),
+    (-60, "Good", ICONS["sig_good"], HEALTHY),
+    (-70, "Fair", ICONS["sig_fair"], DEGRADED),
+)
+_RSSI_POOR = ("Poor", ICONS["sig_poor"], FAILED)
+
+_NUMERIC = (int, float)
+
+# MQTT payload reused every cycle; None values are skipped when sent.
+# The key set is fixed so the dict never grows after the first cycle.
+_readings = {
+    "temp": None,
+    FEED_TEMPERATURE: None,
+    FEED_PH: None,
+    FEED_RSSI: None,
+    "temp_source": None,
+    "ph_source": None,
+    "meta-dot-timestamp": None,
+    "error-32-count": None,
+    "temp_std_dev": None,
+    "ph_std_dev": None,
+}
+
+# Last values pushed to the display: (ph, temp_c, temp_f, rssi)
+_last_display = None
+
+# Last NeoPixel status, for change-only logging
+last_neopixel_status = None
+
+
+def classify_rssi(rssi):
+    """Return (quality, icon, health) for an RSSI value in dBm"""
+    for threshold, quality, icon, health in RSSI_TABLE:
+        if rssi >= threshold:
+            return quality, icon, health
+    return _RSSI_POOR
+
 
 
 def run_sensor_cycle(
@@ -27,8 +125,16 @@ def run_sensor_cycle(
     measurement_manager,
 ):
     """Run the main sensor reading and reporting cycle with robust measurements"""
+    # Collect this cycle's status lines and print them in one write
+    lines = []
+    log = lines.append
+
+    # Bind the most-called manager methods once per cycle
+    set_health = state_manager.update_component_health
+    set_reading = state_manager.update_reading
+
     current_time_str = time_manager.get_local_time_string()
-    print(f"\n📊 Cycle #{main_loop_iterations} at {current_time_str}")
+    log(f"\n{ICONS['stats']} Cycle #{main_loop_iterations} at {current_time_str}")
 
     # Feed watchdog
     state_manager.feed_watchdog()
@@ -42,40 +148,38 @@ def run_sensor_cycle(
         if measurement_manager:
             # Use measurement manager for robust temperature reading
             temp_c, temp_source, temp_quality = measurement_manager.read_temperature()
-            temp_f = temp_c * 9 / 5 + 32
 
             # Add quality info to logs
             if temp_source == "robust" and "std_dev" in temp_quality:
-                print(
-                    f"   📊 Temperature quality: ±{temp_quality['std_dev']:.3f}°C confidence"
+                log(
+                    f"   {ICONS['stats']} Temperature quality: {ICONS['pm']}{temp_quality['std_dev']:.3f}{ICONS['deg_c']} confidence"
                 )
         else:
             # Fallback to single reading
             temp_c, temp_source = safe_read_temperature()
-            temp_f = temp_c * 9 / 5 + 32
             temp_quality = {"method": "single_fallback"}
 
+        temp_f = temp_c * 1.8 + 32
+
         # Set pH temperature compensation
         if ph_sensor:
             ph_sensor.set_temp_compensation(temp_c)
 
-        # Update state based on source and quality
-        if temp_source.startswith("robust"):
-            state_manager.update_component_health("temperature", "healthy")
-        elif temp_source == "fallback":
-            state_manager.update_component_health(
-                "temperature", "failed", "Using fallback temperature"
+        # Update state based on source: only the fallback value is a failure
+        if temp_source == "fallback":
+            set_health(
+                TEMP, FAILED, "Using fallback temperature"
             )
         else:
-            state_manager.update_component_health("temperature", "healthy")
+            set_health(TEMP, HEALTHY)
 
-        state_manager.update_reading("temperature", temp_f)
+        set_reading(TEMP, temp_f)
 
     except Exception as e:
-        print(f"   ❌ Temperature system error: {e}")
+        log(f"   {ICONS['error']} Temperature system error: {e}")
         temp_c, temp_f = nominal_temp_c, nominal_temp_f
         temp_source = "error"
-        state_manager.update_component_health("temperature", "failed", str(e))
+        set_health(TEMP, FAILED, str(e))
 
     # === Enhanced pH reading with robust measurements ===
     try:
@@ -85,7 +189,9 @@ def run_sensor_cycle(
 
             # Add quality info to logs
             if ph_source == "robust" and "std_dev" in ph_quality:
-                print(f"   📊 pH quality: ±{ph_quality['std_dev']:.3f} pH confidence")
+                log(
+                    f"   {ICONS['stats']} pH quality: {ICONS['pm']}{ph_quality['std_dev']:.3f} pH confidence"
+                )
         else:
             # Fallback to single reading
             ph = safe_read_ph()
@@ -93,70 +199,54 @@ def run_sensor_cycle(
             ph_quality = {"method": "single_fallback"}
 
         if ph is not None and isinstance(ph, (int, float)):
-            if ph_source.startswith("robust"):
-                state_manager.update_component_health("ph", "healthy")
-            else:
-                state_manager.update_component_health("ph", "healthy")
-            state_manager.update_reading("ph", ph)
+            set_health(PH, HEALTHY)
+            set_reading(PH, ph)
         else:
-            state_manager.update_component_health("ph", "degraded", "No reading")
+            set_health(PH, DEGRADED, "No reading")
             ph_source = "timeout"  # FIXED: Set ph_source when no reading
-            print(f"   🧪 pH: timeout/error")
+            log(f"   {ICONS['ph']} pH: timeout/error")
 
     except Exception as e:
-        print(f"   ❌ pH system error: {e}")
+        log(f"   {ICONS['error']} pH system error: {e}")
         ph = None
         ph_source = "error"  # FIXED: This was already correct
-        state_manager.update_component_health("ph", "failed", str(e))
+        set_health(PH, FAILED, str(e))
 
     # === Enhanced WiFi monitoring ===
     wifi_status = wifi_manager.get_status()
     rssi = wifi_status.get("rssi")
-    if rssi:
+    if rssi is not None:
         # Add signal quality indicators
-        if rssi >= -50:
-            signal_quality = "Excellent"
-            signal_emoji = "🟢"
-        elif rssi >= -60:
-            signal_quality = "Good"
-            signal_emoji = "🟡"
-        elif rssi >= -70:
-            signal_quality = "Fair"
-            signal_emoji = "🟠"
-        else:
-            signal_quality = "Poor"
-            signal_emoji = "🔴"
-
-        print(f"   📶 WiFi: {rssi} dBm ({signal_quality} {signal_emoji})")
+        signal_quality, signal_icon, wifi_health = classify_rssi(rssi)
+        log(f"   {ICONS['wifi']} WiFi: {rssi} dBm ({signal_quality} {signal_icon})")
 
         # Alert on poor signal
         if rssi <= -70:
             alert_msg = f"Poor WiFi signal: {rssi} dBm"
             state_manager.add_alert(alert_msg, "warning")
 
-        # Update WiFi component health based on signal
-        if rssi >= -60:
-            state_manager.update_component_health("wifi", "healthy")
-        elif rssi >= -70:
-            state_manager.update_component_health(
-                "wifi", "degraded", f"Weak signal: {rssi} dBm"
-            )
-        else:
-            state_manager.update_component_health(
-                "wifi", "failed", f"Poor signal: {rssi} dBm"
-            )
+        # Update WiFi component health based on signal; skip (and don't
+        # build the message) when the state manager already has this level
+        if not state_manager.component_is(WIFI, wifi_health):
+            if wifi_health == HEALTHY:
+                set_health(WIFI, HEALTHY)
+            elif wifi_health == DEGRADED:
+                set_health(
+                    WIFI, DEGRADED, f"Weak signal: {rssi} dBm"
+                )
+            else:
+                set_health(
+                    WIFI, FAILED, f"Poor signal: {rssi} dBm"
+                )
     else:
-        print("   📶 WiFi: No signal data")
-        state_manager.update_component_health("wifi", "degraded", "No signal data")
+        log(f"   {ICONS['wifi']} WiFi: No signal data")
+        set_health(WIFI, DEGRADED, "No signal data")
 
     # Check for WiFi disconnections
     if not wifi_manager.is_connected():
-        print("   ❌ WiFi: DISCONNECTED!")
+        log(f"   {ICONS['error']} WiFi: DISCONNECTED!")
         state_manager.add_alert("WiFi disconnected", "critical")
-        state_manager.update_component_health("wifi", "failed", "Disconnected")
-
-    # Import the NeoPixel function
-    from lib.core.neopixel_status import update_neopixel_status
+        set_health(WIFI, FAILED, "Disconnected")
 
     # Simple NeoPixel Status Update
     current_neopixel_status = update_neopixel_status(
@@ -165,138 +255,141 @@ def run_sensor_cycle(
 
     # Simple status change detection
     global last_neopixel_status
-    if "last_neopixel_status" not in globals():
-        last_neopixel_status = None
-
     if last_neopixel_status != current_neopixel_status:
         if current_neopixel_status == "PROBLEM":
-            print("   🔴 NeoPixel: RED - System has problems")
+            log(f"   {ICONS['red']} NeoPixel: RED - System has problems")
         else:
-            print("   🟢 NeoPixel: GREEN - System OK")
+            log(f"   {ICONS['green']} NeoPixel: GREEN - System OK")
         last_neopixel_status = current_neopixel_status
 
     # Display update (TFT uses SPI, not I2C)
     try:
         if display and ph_label:
-            from lib.oled_display.oled_display import update_display
-
-            display_time = time_manager.get_local_time_string()
-
-            # FIXED: Safe formatting for display values - check if numeric before formatting
-            if isinstance(temp_c, (int, float)):
-                display_temp_c = str(round(temp_c, 1))
+            display_time = current_time_str
+
+            # Full label texts; non-numeric values show "--"
+            display_temp_c = label_text(TEMP_C_TEXT, temp_c)
+            display_temp_f = label_text(TEMP_F_TEXT, temp_f)
+            display_rssi = label_text(RSSI_TEXT, rssi)
+            display_ph = label_text(PH_TEXT, ph)
+
+            # Only the clock changes on a steady reading: refresh just that
+            # label so displayio redraws one small region, not every label
+            global _last_display
+            shown = (display_ph, display_temp_c, display_temp_f, display_rssi)
+            if shown == _last_display:
+                time_label.text = display_time
+                log(f"   {ICONS['display']} Display: time updated")
             else:
-                display_temp_c = "--"
-
-            if isinstance(temp_f, (int, float)):
-                display_temp_f = str(round(temp_f, 1))
-            else:
-                display_temp_f = "--"
-
-            display_rssi = str(int(rssi)) if rssi else "--"
-
-            if isinstance(ph, (int, float)):
-                display_ph = f"{ph:.3f}"
-            else:
-                display_ph = "--"
-
-            # Direct display update (TFT uses SPI, not I2C)
-            update_display(
-                ph_label,
-                temp_c_label,
-                temp_f_label,
-                rssi_label,
-                time_label,
-                display_ph,
-                display_temp_c,
-                display_temp_f,
-                display_rssi,
-                display_time,
-            )
+                # Direct display update (TFT uses SPI, not I2C)
+                update_display(
+                    ph_label,
+                    temp_c_label,
+                    temp_f_label,
+                    rssi_label,
+                    time_label,
+                    display_ph,
+                    display_temp_c,
+                    display_temp_f,
+                    display_rssi,
+                    display_time,
+                )
+                _last_display = shown
+                log(f"   {ICONS['display']} Display: updated")
 
-            state_manager.update_component_health("display", "healthy")
-            print("   🖥️ Display: updated")
+            set_health(DISPLAY, HEALTHY)
         else:
-            print("   🖥️ Display: not available")
+            log(f"   {ICONS['display']} Display: not available")
     except Exception as e:
-        print(f"   ❌ Display error: {e}")
-        state_manager.update_component_health("display", "failed", str(e))
+        log(f"   {ICONS['error']} Display error: {e}")
+        set_health(DISPLAY, FAILED, str(e))
+
+    # System status, shared by MQTT and the cycle summary
+    system_status = state_manager.get_status()
 
     # Enhanced MQTT data transmission with quality metrics
     try:
-        from lib.networking.robust_mqtt import MQTTDataFormatter
-
-        # Format sensor readings
-        sensor_readings = MQTTDataFormatter.format_sensor_readings(
-            temp_c=temp_c, temp_f=temp_f, ph=ph, rssi=rssi
+        # Fill the reused payload in place (same keys and rounding as
+        # MQTTDataFormatter); post_combined() skips None values
+        sensor_readings = _readings
+        sensor_readings["temp"] = (
+            round(temp_c, 2) if isinstance(temp_c, _NUMERIC) else None
         )
-
-        # FIXED: Add measurement source info (no more "unknown")
+        sensor_readings[FEED_TEMPERATURE] = (
+            round(temp_f, 2) if isinstance(temp_f, _NUMERIC) else None
+        )
+        sensor_readings[FEED_PH] = round(ph, 3) if isinstance(ph, _NUMERIC) else None
+        sensor_readings[FEED_RSSI] = int(rssi) if isinstance(rssi, _NUMERIC) else None
+        # Measurement source info (no more "unknown")
         sensor_readings["temp_source"] = temp_source
         sensor_readings["ph_source"] = ph_source
         sensor_readings["meta-dot-timestamp"] = time_manager.get_timestamp_for_data()
-
-        # ADD ERROR 32 COUNT: Include Error 32 count in regular publishing
+        # Include Error 32 count in regular publishing
         sensor_readings["error-32-count"] = mqtt_manager.error_32_count
 
         # Add quality metrics if available
+        # get_reading() returns None when there is no recent value
+        temp_std_dev = None
         if measurement_manager and temp_source == "robust":
-            try:
-                temp_std_dev = state_manager.get_reading("temp_std_dev")
-                if temp_std_dev:
-                    sensor_readings["temp_std_dev"] = round(temp_std_dev, 4)
-            except:
-                pass
+            temp_std_dev = state_manager.get_reading("temp_std_dev")
+        sensor_readings["temp_std_dev"] = (
+            round(temp_std_dev, 4) if temp_std_dev is not None else None
+        )
 
         # FIXED: Simplified pH quality check
+        ph_std_dev = None
         if measurement_manager and ph_source == "robust":
-            try:
-                ph_std_dev = state_manager.get_reading("ph_std_dev")
-                if ph_std_dev:
-                    sensor_readings["ph_std_dev"] = round(ph_std_dev, 4)
-            except:
-                pass
-
-        # Send sensor data
-        sent_count = mqtt_manager.send_readings(sensor_readings)
+            ph_std_dev = state_manager.get_reading("ph_std_dev")
+        sensor_readings["ph_std_dev"] = (
+            round(ph_std_dev, 4) if ph_std_dev is not None else None
+        )
 
-        # Send system status
-        system_status = state_manager.get_status()
-        mqtt_manager.send_system_status(system_status)
+        # Stage sensor data and system state; mqtt_manager.update() publishes
+        # them so the cycle doesn't wait on the network
+        staged_count = mqtt_manager.post_combined(sensor_readings, system_status)
 
         # Check MQTT queue status
         mqtt_status = mqtt_manager.get_status()
         if mqtt_status["messages_queued"] > 0:
             queue_size = mqtt_status["messages_queued"]
-            print(f"   📦 MQTT: {queue_size} messages queued")
+            log(f"   {ICONS['queue']} MQTT: {queue_size} messages queued")
             if queue_size > 5:
                 state_manager.add_alert(
                     f"MQTT queue backing up: {queue_size} messages", "warning"
                 )
 
-        if sent_count > 0:
-            print(f"   📡 MQTT: sent {sent_count} readings")
+        if staged_count > 0:
+            log(
+                f"   {ICONS['send']} MQTT: {staged_count} readings staged for publish"
+            )
         else:
-            print("   📦 MQTT: readings queued")
+            log(f"   {ICONS['queue']} MQTT: no readings to publish")
 
     except Exception as e:
-        print(f"   ❌ MQTT error: {e}")
+        log(f"   {ICONS['error']} MQTT error: {e}")
 
         # Add WiFi diagnostics to MQTT errors
         wifi_connected = wifi_manager.is_connected()
-        current_rssi = wifi_status.get("rssi") if wifi_status else None
-        print(
-            f"   📊 WiFi diagnostics: Connected={wifi_connected}, RSSI={current_rssi}"
+        log(
+            f"   {ICONS['stats']} WiFi diagnostics: Connected={wifi_connected}, RSSI={rssi}"
         )
 
         if not wifi_connected:
-            print("   💡 MQTT error likely due to WiFi disconnection")
-        elif current_rssi and current_rssi < -70:
-            print("   💡 MQTT error likely due to poor WiFi signal")
+            log(f"   {ICONS['hint']} MQTT error likely due to WiFi disconnection")
+        elif rssi is not None and rssi < -70:
+            log(f"   {ICONS['hint']} MQTT error likely due to poor WiFi signal")
 
     # Status summary
-    status = state_manager.get_status()
-    components_ok = sum(1 for h in status["components"].values() if h == "OK")
-    print(f"   📊 System: {status['state']} | Components OK: {components_ok}/7")
+    components_ok = 0
+    for h in system_status["components"].values():
+        if h == "OK":
+            components_ok += 1
+    log(
+        f"   {ICONS['stats']} System: {system_status['state']} | Components OK: {components_ok}/7"
+    )
+    print("\n".join(lines))
+
+    # Collect now, between cycles, rather than mid-read
+    gc.collect()
 
     return temp_c, temp_f, ph, rssi, temp_source
@@ -4,20 +4,37 @@ System Initialization Module
 Handles initialization of all system managers and components
 Extracted from main code.py for better organization
 """
+import gc
 import board
-from lib.core.lean_state import StateManager
-from lib.networking.lean_wifi import WiFiManager
-from lib.networking.robust_mqtt import MQTTManager
-from lib.time_sync.robust_time import TimeManager
-from lib.utilities.i2c_safe import I2CSafeWrapper, create_safe_sensor_reader
-from lib.sensors.ph_sensor import AtlasScientificPH
-from lib.sensors.rtd_sensor import RTDSensor
-from lib.sensors.measurement_integration import create_measurement_manager
-from lib.oled_display.oled_display import (
-    initialize_display,
-    create_display_group,
+from collections import namedtuple
+
+# Handles returned by initialize_system_managers(), fixed-size and read
+# by attribute (handles.wifi_manager) rather than by dict key
+SystemHandles = namedtuple(
+    "SystemHandles",
+    (
+        "state_manager",
+        "i2c_safe",
+        "ph_sensor",
+        "rtd_sensor",
+        "display",
+        "ph_label",
+        "temp_c_label",
+        "temp_f_label",
+        "rssi_label",
+        "time_label",
+        "safe_read_ph",
+        "wifi_manager",
+        "time_manager",
+        "mqtt_manager",
+        "measurement_manager",
+    ),
 )
 
+# Subsystem modules are imported inside initialize_system_managers(), each
+# just before it is needed, so their load-time allocations are spread out
+# and garbage from each stage can be collected before the next loads
+
 
 def initialize_system_managers(
     watchdog_enabled,
@@ -34,24 +51,30 @@ def initialize_system_managers(
 ):
     """Initialize all system managers and components"""
     print("🔧 Initializing robust system management...")
+    gc.collect()
+    # Let the boot sequence allocate ~1/4 of free RAM between automatic
+    # collections (gc.threshold is absent on builds without it)
+    if hasattr(gc, "threshold"):
+        gc.threshold(gc.mem_free() // 4 + gc.mem_alloc())
     if watchdog_enabled:
         wdt.feed()
 
     # Initialize state manager
+    from lib.core.lean_state import StateManager
+
     state_manager = StateManager(watchdog=wdt if watchdog_enabled else None)
+    gc.collect()
 
     # Initialize I2C safety wrapper
     print("🛡️ Initializing I2C safety wrapper...")
+    from lib.utilities.i2c_safe import I2CSafeWrapper, create_safe_sensor_reader
+
     i2c_safe = I2CSafeWrapper(i2c, state_manager)
 
     # Register all components
-    state_manager.register_component("wifi")
-    state_manager.register_component("time")
-    state_manager.register_component("temperature")
-    state_manager.register_component("ph")
-    state_manager.register_component("mqtt")
-    state_manager.register_component("display")
-    state_manager.register_component("i2c")
+    state_manager.register_components(
+        ("wifi", "time", "temperature", "ph", "mqtt", "display", "i2c")
+    )
 
     if watchdog_enabled:
         wdt.feed()
@@ -67,11 +90,17 @@ def initialize_system_managers(
     if watchdog_enabled:
         wdt.feed()
 
+    gc.collect()
+
     # Initialize sensors
+    from lib.sensors.ph_sensor import AtlasScientificPH
+
     ph_sensor = AtlasScientificPH(i2c)
 
     # Initialize RTD sensor
     print("🌡️ Initializing RTD sensor...")
+    from lib.sensors.rtd_sensor import RTDSensor
+
     try:
         rtd_sensor = RTDSensor(spi, board.D12, rtd_wires=3)
         rtd_initialized = rtd_sensor.initialize()
@@ -79,43 +108,58 @@ def initialize_system_managers(
             print("✅ RTD sensor initialized successfully")
         else:
             print("❌ RTD sensor initialization failed")
-    except Exception as e:
-        print(f"❌ RTD sensor error: {e}")
+    except (OSError, RuntimeError, ValueError, MemoryError):
+        # SPI/pin failures and allocation; no traceback or message formatting
+        print("❌ RTD sensor error")
         rtd_sensor = None
 
+    gc.collect()
+
     # Initialize TFT display with shared SPI
     print("🖥️ Initializing TFT display with shared SPI...")
+    from lib.oled_display.oled_display import DisplayHandles
+
     try:
-        display = initialize_display(shared_spi=spi)
-        display_group, ph_label, temp_c_label, temp_f_label, rssi_label, time_label = (
-            create_display_group()
-        )
-        display.root_group = display_group
+        display_handles = DisplayHandles.ensure(shared_spi=spi)
+        display = display_handles.display
+        ph_label = display_handles.ph
+        temp_c_label = display_handles.tc
+        temp_f_label = display_handles.tf
+        rssi_label = display_handles.rssi
+        time_label = display_handles.time
         print("✅ TFT display initialized successfully")
         state_manager.update_component_health("display", "healthy")
-    except Exception as e:
-        print(f"❌ Display initialization failed: {e}")
-        state_manager.update_component_health("display", "failed", str(e))
+    except (OSError, RuntimeError, ValueError, MemoryError):
+        # Display and label construction is the biggest allocation at boot
+        print("❌ Display initialization failed")
+        state_manager.update_component_health("display", "failed", "init failed")
         display = None
         ph_label = temp_c_label = temp_f_label = rssi_label = time_label = None
 
+    gc.collect()
+
     # Create safe sensor reading functions
     safe_read_ph = create_safe_sensor_reader(i2c_safe, ph_sensor, "read_ph")
 
     # Initialize measurement manager
     print("📊 Initializing measurement integration...")
+    from lib.sensors.measurement_integration import create_measurement_manager
+
     measurement_manager = create_measurement_manager(
         state_manager, safe_read_temperature, safe_read_ph
     )
 
     # Initialize robust measurements
     measurement_manager.initialize_robust_measurements(ph_sensor, i2c_safe)
+    gc.collect()
 
     if watchdog_enabled:
         wdt.feed()
 
     # Initialize robust managers
     print("🌐 Initializing robust WiFi manager...")
+    from lib.networking.lean_wifi import WiFiManager
+
     wifi_manager = WiFiManager(
         state_manager,
         wifi_ssid,
@@ -124,30 +168,37 @@ def initialize_system_managers(
         backup_password=None,
         pixel=pixel,
     )
+    gc.collect()
 
     print("🕐 Initializing robust time manager...")
+    from lib.time_sync.robust_time import TimeManager
+
     time_manager = TimeManager(state_manager, wifi_manager, timezone_offset=tz_offset)
+    gc.collect()
 
     print("📡 Initializing robust MQTT manager...")
+    from lib.networking.robust_mqtt import MQTTManager
+
     mqtt_manager = MQTTManager(state_manager, wifi_manager, io_username, io_key)
+    gc.collect()
 
     if watchdog_enabled:
         wdt.feed()
 
-    return {
-        "state_manager": state_manager,
-        "i2c_safe": i2c_safe,
-        "ph_sensor": ph_sensor,
-        "rtd_sensor": rtd_sensor,
-        "display": display,
-        "ph_label": ph_label,
-        "temp_c_label": temp_c_label,
-        "temp_f_label": temp_f_label,
-        "rssi_label": rssi_label,
-        "time_label": time_label,
-        "safe_read_ph": safe_read_ph,
-        "wifi_manager": wifi_manager,
-        "time_manager": time_manager,
-        "mqtt_manager": mqtt_manager,
-        "measurement_manager": measurement_manager,
-    }
+    return SystemHandles(
+        state_manager,
+        i2c_safe,
+        ph_sensor,
+        rtd_sensor,
+        display,
+        ph_label,
+        temp_c_label,
+        temp_f_label,
+        rssi_label,
+        time_label,
+        safe_read_ph,
+        wifi_manager,
+        time_manager,
+        mqtt_manager,
+        measurement_manager,
+    )
@@ -1,6 +1,38 @@
 # Adafruit IO integration using MQTT
 import time
+import json
 import adafruit_minimqtt.adafruit_minimqtt as MQTT
+from micropython import const
+
+# Per-publish and callback logging; const() lets the compiler drop the
+# `if _DEBUG:` blocks entirely when this is 0
+_DEBUG = const(0)
+
+# MiniMQTT client settings. socket_timeout stays at 1 s: loop() rejects a
+# timeout shorter than socket_timeout and is called with its 1 s default
+_KEEP_ALIVE_S = const(30)
+_SOCKET_TIMEOUT_S = const(1)
+_CONNECT_RETRIES = const(1)  # robust_mqtt schedules its own reconnects
+
+
+# Feed topic strings, built once per feed and reused for every publish
+_TOPIC_CACHE = {}
+
+
+def _topic_for(mqtt_client, feed_name):
+    """Return the cached "username/feeds/feed_name" topic"""
+    topic = _TOPIC_CACHE.get(feed_name)
+    if topic is None:
+        topic = mqtt_client._username + "/feeds/" + feed_name
+        _TOPIC_CACHE[feed_name] = topic
+    return topic
+
+# MiniMQTT callbacks, defined once rather than per connect() call
+def _on_connect(mqtt_client, userdata, flags, rc):
+    print(f"Connected to Adafruit IO with result code {rc}")
+
+def _on_disconnect(mqtt_client, userdata, rc):
+    print(f"Disconnected from Adafruit IO with result code {rc}")
 
 def connect_to_adafruit_io(wifi_radio, socketpool_obj, username, key):
     """
@@ -27,23 +59,17 @@ def connect_to_adafruit_io(wifi_radio, socketpool_obj, username, key):
             port=1883,
             username=username,
             password=key,
-            socket_pool=pool
+            socket_pool=pool,
+            keep_alive=_KEEP_ALIVE_S,
+            socket_timeout=_SOCKET_TIMEOUT_S,
+            connect_retries=_CONNECT_RETRIES,
         )
         
-        # Define callback functions
-        def connect(mqtt_client, userdata, flags, rc):
-            print(f"Connected to Adafruit IO with result code {rc}")
-        
-        def disconnect(mqtt_client, userdata, rc):
-            print(f"Disconnected from Adafruit IO with result code {rc}")
-        
-        def publish(mqtt_client, userdata, topic, pid):
-            print(f"Published to {topic} with PID {pid}")
-        
-        # Set up callbacks
-        mqtt_client.on_connect = connect
-        mqtt_client.on_disconnect = disconnect
-        mqtt_client.on_publish = publish
+        if _DEBUG:
+            # Set up callbacks (no on_publish: the send functions log each
+            # publish, and a second f-string per message is churn)
+            mqtt_client.on_connect = _on_connect
+            mqtt_client.on_disconnect = _on_disconnect
         
         # Connect to Adafruit IO MQTT broker
         print("Attempting to connect to Adafruit IO MQTT broker...")
@@ -54,105 +80,85 @@ def connect_to_adafruit_io(wifi_radio, socketpool_obj, username, key):
         
         print("Successfully connected to Adafruit IO MQTT!")
         return mqtt_client
+    except MemoryError:
+        raise  # Let the caller free memory before retrying
     except Exception as e:
         print(f"Failed to connect to Adafruit IO: {e}")
         return None
 
-def send_data_to_feed(mqtt_client, feed_name, value):
+def reconnect_to_adafruit_io(mqtt_client):
     """
-    Send data to an Adafruit IO feed using MQTT
+    Reconnect an existing MQTT client instead of building a new one
     
     Args:
-        mqtt_client: MQTT client object
-        feed_name: Name of the feed
-        value: Value to send
+        mqtt_client: client returned by an earlier connect_to_adafruit_io()
         
     Returns:
-        True if successful, False otherwise
+        The same MQTT client if successful, None otherwise
     """
     try:
-        # Format the value as a string
-        if isinstance(value, float):
-            value_str = f"{value:.3f}"  # Use 3 decimal places for pH values
-        else:
-            value_str = str(value)
-        
+        print("Reconnecting to Adafruit IO MQTT broker...")
+        # Nothing is subscribed, so skip the resubscribe pass
+        mqtt_client.reconnect(resub_topics=False)
+        return mqtt_client
+    except MemoryError:
+        raise  # Let the caller free memory before retrying
+    except Exception as e:
+        print(f"Failed to reconnect to Adafruit IO: {e}")
+        return None
+
+def _publish_value(mqtt_client, feed_name, value_str, flush):
+    """Publish an already formatted value (str or ASCII bytes) to a feed"""
+    try:
         # Format the topic according to Adafruit IO requirements
         # The format should be: username/feeds/feedname
-        username = mqtt_client._username
-        topic = f"{username}/feeds/{feed_name}"
-        
-        print(f"Publishing {value_str} to topic: {topic}")
-        
+        topic = _topic_for(mqtt_client, feed_name)
+
+        if _DEBUG:
+            print(f"Publishing {value_str} to topic: {topic}")
+
         # Publish the data
         mqtt_client.publish(topic, value_str)
-        mqtt_client.loop()  # Process network traffic
-        
+        if flush:
+            mqtt_client.loop()  # Process network traffic
+
         return True
     except Exception as e:
         print(f"Error sending data to feed: {e}")
-        return False# Adafruit IO integration using MQTT
-import time
-import socketpool
-import adafruit_minimqtt.adafruit_minimqtt as MQTT
+        return False
 
-def connect_to_adafruit_io(wifi_radio, socketpool_obj, username, key):
+def _milli_bytes(value):
     """
-    Connect to Adafruit IO using MQTT
-    
-    Args:
-        wifi_radio: wifi.radio object
-        socketpool_obj: socketpool object
-        username: Adafruit IO username
-        key: Adafruit IO key
-        
-    Returns:
-        MQTT client if successful, None otherwise
+    Format a float to 3 decimals with integer math (no float-to-string),
+    as ASCII bytes so MiniMQTT publishes them without a UTF-8 encode
     """
+    milli = int(value * 1000 + (0.5 if value >= 0 else -0.5))
+    if milli < 0:
+        milli = -milli
+        return b"-%d.%03d" % (milli // 1000, milli % 1000)
+    return b"%d.%03d" % (milli // 1000, milli % 1000)
+
+def send_float(mqtt_client, feed_name, value, flush=False):
+    """Send a float to a feed with 3 decimal places (pH, temperature)"""
+    # Not a number (a feed cached as float later sent a str): use str().
+    # Checked up front: str * 1000 would build a 1000x copy before failing
+    if not isinstance(value, (int, float)):
+        return send_int(mqtt_client, feed_name, value, flush)
     try:
-        print(f"Connecting to Adafruit IO as user: {username}")
-        
-        # Create a socket pool
-        pool = socketpool_obj
-        
-        # Set up a MiniMQTT Client directly (not using IO_MQTT wrapper)
-        mqtt_client = MQTT.MQTT(
-            broker="io.adafruit.com",
-            port=1883,
-            username=username,
-            password=key,
-            socket_pool=pool
-        )
-        
-        # Define callback functions
-        def connect(mqtt_client, userdata, flags, rc):
-            print(f"Connected to Adafruit IO with result code {rc}")
-        
-        def disconnect(mqtt_client, userdata, rc):
-            print(f"Disconnected from Adafruit IO with result code {rc}")
-        
-        def publish(mqtt_client, userdata, topic, pid):
-            print(f"Published to {topic} with PID {pid}")
-        
-        # Set up callbacks
-        mqtt_client.on_connect = connect
-        mqtt_client.on_disconnect = disconnect
-        mqtt_client.on_publish = publish
-        
-        # Connect to Adafruit IO MQTT broker
-        print("Attempting to connect to Adafruit IO MQTT broker...")
-        mqtt_client.connect()
-        
-        # Store username as attribute for easier topic creation
-        mqtt_client._username = username
-        
-        print("Successfully connected to Adafruit IO MQTT!")
-        return mqtt_client
-    except Exception as e:
-        print(f"Failed to connect to Adafruit IO: {e}")
-        return None
+        value_str = _milli_bytes(value)
+    except (OverflowError, ValueError):
+        value_str = "%.3f" % value  # nan/inf
+    return _publish_value(mqtt_client, feed_name, value_str, flush)
 
-def send_data_to_feed(mqtt_client, feed_name, value):
+def send_int(mqtt_client, feed_name, value, flush=False):
+    """Send an int (RSSI) or any other str()-formatted value to a feed"""
+    return _publish_value(mqtt_client, feed_name, str(value), flush)
+
+def sender_for(value):
+    """Pick the specialised send function for a value's type"""
+    return send_float if isinstance(value, float) else send_int
+
+def send_data_to_feed(mqtt_client, feed_name, value, flush=False):
     """
     Send data to an Adafruit IO feed using MQTT
     
@@ -160,26 +166,26 @@ def send_data_to_feed(mqtt_client, feed_name, value):
         mqtt_client: MQTT client object
         feed_name: Name of the feed
         value: Value to send
+        flush: Run mqtt_client.loop() after publishing. Leave False when
+            sending several feeds and call loop() once after the last one
         
     Returns:
         True if successful, False otherwise
     """
-    try:
-        # Format the value as a string
-        value_str = f"{value:.3f}"
-        
-        # Format the topic according to Adafruit IO requirements
-        # The format should be: username/feeds/feedname
-        username = mqtt_client._username
-        topic = f"{username}/feeds/{feed_name}"
-        
-        print(f"Publishing {value_str} to topic: {topic}")
-        
-        # Publish the data
-        mqtt_client.publish(topic, value_str)
-        mqtt_client.loop()  # Process network traffic
-        
-        return True
-    except Exception as e:
-        print(f"Error sending data to feed: {e}")
-        return False
+    return sender_for(value)(mqtt_client, feed_name, value, flush)
+
+def send_data_to_group(mqtt_client, group_name, feeds):
+    """
+    Publish several feed values in one message via an Adafruit IO group
+    
+    Raises on failure (unlike send_data_to_feed) so the caller sees the
+    error itself and can queue the values and reconnect
+    """
+    username = mqtt_client._username
+    topic = f"{username}/groups/{group_name}"
+    payload = json.dumps({"feeds": feeds})
+    if _DEBUG:
+        print(f"Publishing {len(feeds)} values to topic: {topic}")
+    mqtt_client.publish(topic, payload)
+    mqtt_client.loop()
+    return True
@@ -8,6 +8,15 @@ import time
 import wifi
 import socketpool
 
+# Status pixel colors (dim to save power), packed as 0xRRGGBB ints so the
+# pixel setter takes its small-int path instead of unpacking a tuple
+_PIXEL_COLORS = {
+    "connecting": 0x191900,  # Yellow (25, 25, 0)
+    "connected": 0x001900,  # Green (0, 25, 0)
+    "failed": 0x190000,  # Red (25, 0, 0)
+}
+_PIXEL_OFF = 0x000000
+
 
 class WiFiManager:
     """Lean WiFi manager optimized for ESP32-S3 constraints"""
@@ -30,6 +39,9 @@ class WiFiManager:
 
         # Minimal state tracking (UNCHANGED)
         self.socket_pool = None
+        # One SocketPool for the radio, reused across reconnects so MQTT
+        # rebinds to the same pool instead of a fresh one each time
+        self._radio_pool = None
         self.last_rssi_check = 0
         self.consecutive_failures = 0
         self.connection_attempts = 0
@@ -37,10 +49,25 @@ class WiFiManager:
         self.is_backup_network = False
         self.last_connection_time = 0
 
+        # ap_info is rebuilt by the radio on every access; cache it between
+        # RSSI checks instead of fetching it on each status call
+        self._ap_info_cache = None
+        self._ap_info_ts = 0
+
+        # check_connection() does nothing before _next_check_ts: connected,
+        # that is the next radio probe (every _check_interval); after a
+        # failure, the end of the reconnect backoff
+        self._check_interval = 2.0
+        self._next_check_ts = 0
+        self._last_connected_result = False
+
         # MINIMAL ADDITION: Simple auto-recovery tracking
         self.mqtt_error_count = 0
         self.last_network_reset = 0
 
+        # Progress/diagnostic prints on steady-state paths (USB serial blocks)
+        self.debug = False
+
         # Lean configuration (UNCHANGED)
         self.rssi_check_interval = 60  # Check signal every minute
         self.connection_timeout = 20  # Reduced timeout
@@ -53,6 +80,24 @@ class WiFiManager:
         self.recovery_mqtt_threshold = 3  # Trigger after 3 MQTT errors
         self.recovery_cooldown = 300  # 5 minutes between resets
 
+        # IP string for get_status(), rebuilt only after a new connection
+        self._ip_str = None
+        self._ip_conn_time = None
+
+        # Status dict reused by get_status() (updated in place)
+        self._status = {
+            "connected": False,
+            "ip": None,
+            "rssi": None,
+            "failures": 0,
+            "backup": False,
+            "attempts": 0,
+            "success_count": 0,
+            "uptime": 0,
+            "mqtt_errors": 0,
+            "success_rate": 0,
+        }
+
         # Register with state manager
         state_manager.register_component("wifi")
 
@@ -83,9 +128,8 @@ class WiFiManager:
 
             # Disconnect if connected to wrong network
             if wifi.radio.connected:
-                current_ssid = (
-                    wifi.radio.ap_info.ssid if wifi.radio.ap_info else "unknown"
-                )
+                ap = wifi.radio.ap_info
+                current_ssid = ap.ssid if ap else "unknown"
                 if current_ssid != ssid:
                     print(f"   Disconnecting from {current_ssid}")
                     wifi.radio.stop_station()
@@ -93,28 +137,34 @@ class WiFiManager:
 
             wifi.radio.connect(ssid, password, timeout=self.connection_timeout)
 
-            if wifi.radio.connected:
-                self.socket_pool = socketpool.SocketPool(wifi.radio)
-                self.consecutive_failures = 0
-                self.successful_connections += 1
-                self.is_backup_network = is_backup
-                self.last_connection_time = time.monotonic()
-
-                # MINIMAL ADDITION: Reset error count on successful connection
-                self.mqtt_error_count = 0
-
-                # Get connection info
-                ip = wifi.radio.ipv4_address
-                rssi = wifi.radio.ap_info.rssi if wifi.radio.ap_info else None
-
-                print(f"   ✅ Connected to {ssid}")
-                print(f"   IP: {ip}")
-                if rssi:
-                    print(f"   Signal: {rssi} dBm")
-
-                self._set_pixel("connected")
-                self.state_manager.update_component_health("wifi", "healthy")
-                return True
+            # connect() raises on failure, so reaching here means connected
+            if self._radio_pool is None:
+                self._radio_pool = socketpool.SocketPool(wifi.radio)
+            self.socket_pool = self._radio_pool
+            self.consecutive_failures = 0
+            self.successful_connections += 1
+            self.is_backup_network = is_backup
+            now = time.monotonic()
+            self.last_connection_time = now
+            self._last_connected_result = True
+            self._next_check_ts = now + self._check_interval
+
+            # MINIMAL ADDITION: Reset error count on successful connection
+            self.mqtt_error_count = 0
+
+            # Get connection info
+            ip = wifi.radio.ipv4_address
+            ap_info = self._get_ap_info(now, refresh=True)
+            rssi = ap_info.rssi if ap_info else None
+
+            print(f"   ✅ Connected to {ssid}")
+            print(f"   IP: {ip}")
+            if rssi:
+                print(f"   Signal: {rssi} dBm")
+
+            self._set_pixel("connected")
+            self._mark_healthy()
+            return True
 
         except Exception as e:
             print(f"   ❌ Connection to {ssid} failed: {e}")
@@ -125,6 +175,12 @@ class WiFiManager:
         """Handle connection failure (UNCHANGED)"""
         self.consecutive_failures += 1
         self.socket_pool = None
+        # Exponential backoff before check_connection() retries (max 5 min)
+        self._next_check_ts = time.monotonic() + min(
+            self.retry_delay * (1 << min(self.consecutive_failures, 6)), 300
+        )
+        self._last_connected_result = False
+        self._ap_info_cache = None
         self._set_pixel("failed")
 
         health = "failed" if self.consecutive_failures > 3 else "degraded"
@@ -134,46 +190,74 @@ class WiFiManager:
         print(f"   ❌ All networks failed (failure #{self.consecutive_failures})")
 
     def check_connection(self):
-        """Lightweight connection monitoring (UNCHANGED)"""
+        """Lightweight connection monitoring, probing the radio every ~2s"""
         current_time = time.monotonic()
 
+        # Between probes, or still backing off: reuse the last result
+        if current_time < self._next_check_ts:
+            return self._last_connected_result
+        self._next_check_ts = current_time + self._check_interval
+
         # Check if still connected
         if not wifi.radio.connected:
             print("⚠️  WiFi connection lost - attempting reconnect...")
-            self._handle_failure()
+            # Show the loss now; a failed connect() records the failure
+            self.socket_pool = None
+            self._set_pixel("failed")
 
-            # Attempt automatic reconnection
+            # Attempt automatic reconnection (success or failure moves
+            # _next_check_ts and _last_connected_result)
             if self.connect():
                 print("✅ WiFi automatically reconnected")
 
-            return wifi.radio.connected
+            return self._last_connected_result
+
+        self._last_connected_result = True
 
         # Check RSSI periodically
         if current_time - self.last_rssi_check > self.rssi_check_interval:
             self.last_rssi_check = current_time
-            try:
-                rssi = wifi.radio.ap_info.rssi if wifi.radio.ap_info else None
-                if rssi:
-                    if rssi < self.min_acceptable_rssi:
-                        self.state_manager.update_component_health(
-                            "wifi", "degraded", f"Weak signal: {rssi}dBm"
-                        )
-                    else:
-                        self.state_manager.update_component_health("wifi", "healthy")
-            except Exception as e:
-                print(f"RSSI check error: {e}")
+            # ap_info is None when the radio has no AP; no try/except needed
+            ap_info = self._get_ap_info(current_time)
+            if ap_info is None:
+                return True
+            rssi = ap_info.rssi
+            if rssi < self.min_acceptable_rssi:
+                self.state_manager.update_component_health(
+                    "wifi", "degraded", f"Weak signal: {rssi}dBm"
+                )
+            else:
+                self._mark_healthy()
 
         return True
 
+    def _mark_healthy(self):
+        """Report healthy only if the state manager doesn't already say so"""
+        # Checked against the state manager, not a local memo,
+        # since sensor_cycle also writes this component's health
+        if not self.state_manager.component_is("wifi", "healthy"):
+            self.state_manager.update_component_health("wifi", "healthy")
+
+    def _get_ap_info(self, now, refresh=False):
+        """Return cached ap_info, refreshed at most once per rssi_check_interval"""
+        if refresh or now - self._ap_info_ts > self.rssi_check_interval:
+            self._ap_info_cache = wifi.radio.ap_info
+            self._ap_info_ts = now
+        return self._ap_info_cache
+
     def report_mqtt_error(self, error_type="unknown"):
         """MINIMAL ADDITION: Simple MQTT error reporting for auto-recovery"""
         self.mqtt_error_count += 1
         current_time = time.monotonic()
 
-        print(f"📡 MQTT error reported: {error_type} (count: {self.mqtt_error_count})")
+        if self.debug:
+            print(
+                f"📡 MQTT error reported: {error_type} (count: {self.mqtt_error_count})"
+            )
 
         # Check if we should trigger recovery
-        rssi = wifi.radio.ap_info.rssi if wifi.radio.ap_info else None
+        ap = self._get_ap_info(current_time)
+        rssi = ap.rssi if ap is not None else None
         if (
             rssi
             and rssi <= self.recovery_rssi_threshold
@@ -218,12 +302,7 @@ class WiFiManager:
         if not self.pixel:
             return
         try:
-            colors = {
-                "connecting": (25, 25, 0),  # Yellow
-                "connected": (0, 25, 0),  # Green
-                "failed": (25, 0, 0),  # Red
-            }
-            self.pixel[0] = colors.get(status, (0, 0, 0))
+            self.pixel[0] = _PIXEL_COLORS.get(status, _PIXEL_OFF)
         except:
             pass
 
@@ -270,17 +349,21 @@ class WiFiManager:
             current_time - self.last_connection_time if self.last_connection_time else 0
         )
 
-        status = {
-            "connected": self.is_connected(),
-            "ip": str(wifi.radio.ipv4_address) if wifi.radio.connected else None,
-            "rssi": wifi.radio.ap_info.rssi if wifi.radio.ap_info else None,
-            "failures": self.consecutive_failures,
-            "backup": self.is_backup_network,
-            "attempts": self.connection_attempts,
-            "success_count": self.successful_connections,
-            "uptime": connection_uptime,
-            "mqtt_errors": self.mqtt_error_count,  # MINIMAL ADDITION
-        }
+        connected = wifi.radio.connected
+        ap_info = self._get_ap_info(current_time) if connected else None
+        status = self._status
+        status["connected"] = self.is_connected()
+        if connected and self._ip_conn_time != self.last_connection_time:
+            self._ip_conn_time = self.last_connection_time
+            self._ip_str = str(wifi.radio.ipv4_address)
+        status["ip"] = self._ip_str if connected else None
+        status["rssi"] = ap_info.rssi if ap_info else None
+        status["failures"] = self.consecutive_failures
+        status["backup"] = self.is_backup_network
+        status["attempts"] = self.connection_attempts
+        status["success_count"] = self.successful_connections
+        status["uptime"] = connection_uptime
+        status["mqtt_errors"] = self.mqtt_error_count  # MINIMAL ADDITION
 
         # Calculate success rate
         if self.connection_attempts > 0:
@@ -5,15 +5,32 @@ Handles connections, queuing, reconnections, and data publishing
 Memory optimized for CircuitPython
 ULTRA-MINIMAL: Error 32 detection only, no emergency publishing
 """
+import gc
 import time
+import random
 import wifi
-from lib.networking.adafruit_io_mqtt import connect_to_adafruit_io, send_data_to_feed
+import microcontroller
+from collections import deque
+from lib.networking.adafruit_io_mqtt import (
+    connect_to_adafruit_io,
+    reconnect_to_adafruit_io,
+    send_data_to_group,
+    sender_for,
+)
 import os
 
 # Import feed names from settings.toml
 FEED_PH = os.getenv("FEED_PH", "pH2-1")
 FEED_TEMPERATURE = os.getenv("FEED_TEMPERATURE", "pH2Temp-2")
 FEED_RSSI = os.getenv("FEED_RSSI", "pH2RSSI-1")
+FEED_GROUP = os.getenv("FEED_GROUP", "default")  # Group for combined publishes
+
+_NUMERIC = (int, float)  # built once, not per isinstance() call
+_EPIPE = 32  # "Error 32": broken pipe (CircuitPython's errno has no EPIPE)
+
+# update() states
+_DISCONNECTED = "DISCONNECTED"
+_CONNECTED = "CONNECTED"
 
 
 class MQTTManager:
@@ -28,23 +45,58 @@ class MQTTManager:
         self.username = username
         self.key = key
 
-        # MQTT client state
+        # MQTT client state. self.client is the live connection (None while
+        # disconnected); _mqtt_client keeps the MiniMQTT object across
+        # reconnects so it isn't rebuilt each time, until reset()
         self.client = None
+        self._mqtt_client = None
         self.last_connection_attempt = 0
         self.connection_attempts = 0
         self.successful_connections = 0
         self.consecutive_failures = 0
 
-        # Data queuing (keep small for memory constraints)
-        self.message_queue = []
+        # Data queuing (keep small for memory constraints).
+        # Messages are (feed, value, timestamp) tuples: no per-message dict
         self.max_queue_size = 10  # Keep queue small for ESP32-S3
+        self.max_message_age = 300  # Seconds before a queued message is stale
+        self.message_queue = deque((), self.max_queue_size)  # FIFO, O(1) ends
+        # Oldest queued message, held outside the deque so it can be read or
+        # put back: CircuitPython 9's deque has no indexing or appendleft()
+        self._queue_head = None
         self.last_send_attempt = 0
 
+        # Combined payload staged by post_combined(), sent by update()
+        self._pending = None
+        self._pending_time = 0
+
+        # Per-feed send function (send_float/send_int), chosen on first use
+        self._sender_for = {}
+
         # FIXED: Faster timing settings for better responsiveness
         self.reconnect_interval = 5  # CHANGED: Try reconnect every 5 seconds (was 30)
         self.send_interval = 0.5  # CHANGED: Faster sending (was 1)
         self.connection_timeout = 15  # Connection timeout
 
+        # Reconnect backoff: doubles per failed attempt up to _backoff_max,
+        # back to reconnect_interval once connected. Kept unjittered; the
+        # +/-20% jitter goes on each retry deadline (_disconnected())
+        self._backoff = self.reconnect_interval
+        self._backoff_max = 128
+
+        # update() runs one state step per deadline instead of comparing
+        # several intervals every tick; transitions move _next_action_at
+        self._state = _DISCONNECTED
+        self._next_action_at = 0
+
+        # Failure watchdog: past max_retry_watchdog failed connects in a row
+        # (2x the 5 that mark MQTT "failed", +1) reset WiFi if it is down;
+        # past twice that, reset the board
+        self.enable_watchdog = True
+        self.max_retry_watchdog = 2 * 5 + 1
+
+        # Progress/diagnostic prints on steady-state paths (USB serial blocks)
+        self.debug = False
+
         # Statistics
         self.messages_sent = 0
         self.messages_queued = 0
@@ -53,6 +105,28 @@ class MQTTManager:
         # ULTRA-MINIMAL ADDITION: Simple Error 32 counter only
         self.error_32_count = 0
 
+        # Send failures in a row; health is reported on the 1st, 4th, 7th...
+        # (same threshold as WiFiManager.recovery_mqtt_threshold)
+        self._consecutive_send_failures = 0
+        self.send_failure_report_every = 3
+
+        # Status dict reused by get_status() (updated in place)
+        self._status = {
+            "connected": False,
+            "connection_attempts": 0,
+            "successful_connections": 0,
+            "consecutive_failures": 0,
+            "success_rate": 0,
+            "messages_sent": 0,
+            "messages_queued": 0,
+            "messages_dropped": 0,
+            "queue_age": 0,
+            "last_attempt": 0,
+            "next_attempt_in": 0,
+            "error_32_count": 0,
+        }
+        self._rate_attempts = 0  # connection_attempts behind success_rate
+
         # Register with state manager
         state_manager.register_component("mqtt")
 
@@ -67,17 +141,16 @@ class MQTTManager:
         # FIXED: Force immediate connection attempt
         print("🔗 Attempting immediate MQTT connection...")
         self.last_connection_attempt = 0  # Reset to allow immediate attempt
+        self._next_action_at = 0
         return self._attempt_connection()
 
     def _attempt_connection(self):
         """Attempt to connect to MQTT broker"""
         current_time = time.monotonic()
 
-        # FIXED: Allow immediate attempt on first connection or after interval
-        if (
-            self.connection_attempts > 0
-            and (current_time - self.last_connection_attempt) < self.reconnect_interval
-        ):
+        # FIXED: Allow immediate attempt on first connection or after the
+        # (jittered) retry deadline
+        if self.connection_attempts > 0 and current_time < self._next_action_at:
             return False
 
         self.last_connection_attempt = current_time
@@ -89,22 +162,34 @@ class MQTTManager:
             if not socket_pool:
                 raise Exception("No socket pool available")
 
-            print(f"  Using socket pool: {socket_pool}")
-            print(f"  WiFi radio: {wifi.radio}")
-            print(f"  Username: {self.username}")
+            if self.debug:
+                print(f"  Using socket pool: {socket_pool}")
+                print(f"  WiFi radio: {wifi.radio}")
+                print(f"  Username: {self.username}")
 
-            # Connect to Adafruit IO
-            self.client = connect_to_adafruit_io(
-                wifi.radio, socket_pool, self.username, self.key
-            )
+            # Collect first so the client's socket buffers find contiguous RAM
+            gc.collect()
+
+            # Connect to Adafruit IO, reusing the client from last time
+            if self._mqtt_client is None:
+                self.client = connect_to_adafruit_io(
+                    wifi.radio, socket_pool, self.username, self.key
+                )
+            else:
+                self.client = reconnect_to_adafruit_io(self._mqtt_client)
+            # A failed reconnect builds a fresh client on the next attempt
+            self._mqtt_client = self.client
 
             if self.client and self.client.is_connected():
                 self.successful_connections += 1
                 self.consecutive_failures = 0
+                self._backoff = self.reconnect_interval
+                self._state = _CONNECTED
+                self._next_action_at = current_time + self.send_interval
                 print(
                     f"✅ MQTT connected successfully (#{self.successful_connections})"
                 )
-                self.state_manager.update_component_health("mqtt", "healthy")
+                self._mark_healthy()
 
                 # Process any queued messages immediately
                 self._process_queue()
@@ -112,15 +197,33 @@ class MQTTManager:
             else:
                 raise Exception("Connection returned None or not connected")
 
+        except MemoryError:
+            # Heap too fragmented for the connection: drop the retry queue
+            # and collect so the next attempt has room
+            self.client = None
+            self._mqtt_client = None  # its buffers go with it
+            self.messages_dropped += self._queue_len()
+            self._clear_queue()
+            gc.collect()
+            self.consecutive_failures += 1
+            self._backoff = min(self._backoff_max, self._backoff * 2)
+            self._disconnected(current_time)
+            print("❌ MQTT connection failed: out of memory (queue cleared)")
+            self.state_manager.update_component_health("mqtt", "degraded", "oom")
+            self._check_watchdog()
+            return False
+
         except Exception as e:
             self.consecutive_failures += 1
+            self._backoff = min(self._backoff_max, self._backoff * 2)
             error_msg = f"Connection failed: {e}"
             print(f"❌ MQTT connection failed: {error_msg}")
-            print(f"  Error type: {type(e)}")
-            print(f"  WiFi connected: {self.wifi_manager.is_connected()}")
-            print(
-                f"  Socket pool available: {self.wifi_manager.get_socket_pool() is not None}"
-            )
+            if self.debug:
+                # get_socket_pool() is non-None exactly when is_connected()
+                wifi_up = self.wifi_manager.is_connected()
+                print(f"  Error type: {type(e)}")
+                print(f"  WiFi connected: {wifi_up}")
+                print(f"  Socket pool available: {wifi_up}")
             print(f"  Consecutive failures: {self.consecutive_failures}")
 
             # Determine health status based on failure count
@@ -131,8 +234,29 @@ class MQTTManager:
 
             self.state_manager.update_component_health("mqtt", health, error_msg)
             self.client = None
+            self._disconnected(current_time)
+            self._check_watchdog()
             return False
 
+    def _check_watchdog(self):
+        """Recover from a long run of failed connects: WiFi reset, then reboot"""
+        if not self.enable_watchdog:
+            return
+        failures = self.consecutive_failures
+        if failures > 2 * self.max_retry_watchdog:
+            print(f"🔄 MQTT watchdog: {failures} failed connects - resetting board...")
+            time.sleep(1)
+            microcontroller.reset()
+        if failures > self.max_retry_watchdog and not self.wifi_manager.is_connected():
+            print(f"🔄 MQTT watchdog: {failures} failed connects - resetting WiFi...")
+            self.wifi_manager.reset()
+
+    def _disconnected(self, since):
+        """Enter the DISCONNECTED state, next reconnect one backoff after since"""
+        self._state = _DISCONNECTED
+        # Jitter the deadline, not _backoff, so it doesn't compound
+        self._next_action_at = since + self._backoff * random.uniform(0.8, 1.2)
+
     def is_connected(self):
         """Check if MQTT is connected and healthy"""
         if not self.client:
@@ -144,7 +268,7 @@ class MQTTManager:
 
     def send_reading(self, feed_name, value):
         """Send a single reading to MQTT feed"""
-        message = {"feed": feed_name, "value": value, "timestamp": time.monotonic()}
+        message = (feed_name, value, time.monotonic())
 
         if self._send_message(message):
             return True
@@ -154,20 +278,8 @@ class MQTTManager:
             return False
 
     def send_readings(self, readings_dict):
-        """Send multiple readings at once"""
-        current_time = time.monotonic()
-        success_count = 0
-
-        for feed_name, value in readings_dict.items():
-            if value is not None:  # Only send valid readings
-                message = {"feed": feed_name, "value": value, "timestamp": current_time}
-
-                if self._send_message(message):
-                    success_count += 1
-                else:
-                    self._queue_message(message)
-
-        return success_count
+        """Send multiple readings at once (one group publish for all feeds)"""
+        return self.send_combined(readings_dict)
 
     def send_system_status(self, system_status):
         """Send system status information"""
@@ -176,6 +288,69 @@ class MQTTManager:
         }
         return self.send_readings(status_readings)
 
+    def send_combined(self, readings_dict, system_status=None):
+        """Send readings and system state as a single group publish"""
+        feeds = self._combined_feeds(readings_dict, system_status)
+        if not feeds:
+            return 0
+        return self._publish_feeds(feeds, time.monotonic())
+
+    def post_combined(self, readings_dict, system_status=None):
+        """
+        Stage readings and system state for the next update() call
+        Returns immediately so sensor reads aren't held up by the network
+        """
+        if self._pending is not None:
+            # The previous payload never went out - hand it to the retry queue
+            self._queue_feeds(self._pending, self._pending_time)
+        feeds = self._combined_feeds(readings_dict, system_status)
+        self._pending = feeds or None
+        self._pending_time = time.monotonic()
+        return len(feeds)
+
+    def _combined_feeds(self, readings_dict, system_status):
+        """Drop empty readings and add the system state"""
+        feeds = {k: v for k, v in readings_dict.items() if v is not None}
+        if system_status is not None:
+            feeds["system-state"] = system_status.get("state", "UNKNOWN")
+        return feeds
+
+    def _publish_feeds(self, feeds, timestamp):
+        """Group-publish feeds, falling back to the per-feed queue"""
+        if self._send_group(feeds):
+            return len(feeds)
+        self._queue_feeds(feeds, timestamp)
+        return 0
+
+    def _queue_feeds(self, feeds, timestamp):
+        """Queue each feed value so _process_queue() can retry it"""
+        for feed_name, value in feeds.items():
+            self._queue_message(
+                (feed_name, value, timestamp)
+            )
+
+    def _send_group(self, feeds):
+        """Attempt one group publish covering all feeds"""
+        current_time = time.monotonic()
+
+        if (current_time - self.last_send_attempt) < self.send_interval:
+            return False
+
+        self.last_send_attempt = current_time
+
+        if not self.is_connected():
+            return False
+
+        try:
+            send_data_to_group(self.client, FEED_GROUP, feeds)
+            self.messages_sent += len(feeds)
+            self._send_succeeded()
+            return True
+
+        except Exception as e:
+            self._handle_send_error(e)
+            return False
+
     def _send_message(self, message):
         """Attempt to send a single message with ultra-minimal Error 32 detection"""
         current_time = time.monotonic()
@@ -191,139 +366,248 @@ class MQTTManager:
             return False  # Don't attempt reconnection here, let update() handle it
 
         try:
-            # Send using existing function
-            send_data_to_feed(self.client, message["feed"], message["value"])
+            self._send_feed(message[0], message[1], flush=True)
             self.messages_sent += 1
 
             # Update health status on successful send
-            self.state_manager.update_component_health("mqtt", "healthy")
+            self._send_succeeded()
             return True
 
         except Exception as e:
-            error_str = str(e)
+            self._handle_send_error(e)
+            return False
+
+    def _send_feed(self, feed, value, flush=False):
+        """
+        Publish one feed value with the sender cached for that feed
+        The senders report failure by returning False; raise instead so
+        callers handle it like any other publish error
+        """
+        sender = self._sender_for.get(feed)
+        if sender is None:
+            sender = self._sender_for[feed] = sender_for(value)
+        if not sender(self.client, feed, value, flush):
+            raise RuntimeError(f"Publish to {feed} failed")
+
+    def _mark_healthy(self):
+        """Report healthy only if the state manager doesn't already say so"""
+        # Skip the update when already healthy; fires on every publish otherwise
+        if not self.state_manager.component_is("mqtt", "healthy"):
+            self.state_manager.update_component_health("mqtt", "healthy")
 
-            # ULTRA-MINIMAL: Just detect Error 32 and report to WiFi manager
-            if "32" in error_str:
-                self.error_32_count += 1
+    def _handle_send_error(self, e):
+        """Record a failed publish and drop the client for reconnection"""
+        # ULTRA-MINIMAL: Just detect Error 32 and report to WiFi manager.
+        # Check the errno first; only exceptions without one (MiniMQTT's
+        # own) are matched on their text
+        code = getattr(e, "errno", None)
+        if code is None:
+            is_epipe = "Errno 32" in str(e)
+        else:
+            is_epipe = code == _EPIPE
+        if is_epipe:
+            self.error_32_count += 1
+            if self.debug:
                 print(f"🚨 MQTT Error 32 detected (count: {self.error_32_count})")
 
-                # Report to WiFi manager for correlation analysis
-                if hasattr(self.wifi_manager, "report_mqtt_error"):
-                    self.wifi_manager.report_mqtt_error("error_32")
+            # Report to WiFi manager for correlation analysis
+            if hasattr(self.wifi_manager, "report_mqtt_error"):
+                self.wifi_manager.report_mqtt_error("error_32")
 
-            print(f"❌ MQTT send error: {e}")
-            # Mark client as disconnected on send failure
-            self.client = None
+        print(f"❌ MQTT send error: {e}")
+        # Mark client as disconnected on send failure
+        self.client = None
+        self._disconnected(self.last_connection_attempt)
+
+        # Hysteresis: one state update per run of failures, not every one
+        self._consecutive_send_failures += 1
+        if (self._consecutive_send_failures - 1) % self.send_failure_report_every == 0:
             self.state_manager.update_component_health(
                 "mqtt", "degraded", f"Send failed: {e}"
             )
-            return False
+
+    def _send_succeeded(self):
+        """Reset the send-failure run and report healthy if needed"""
+        self._consecutive_send_failures = 0
+        self._mark_healthy()
+
+    def _peek_queue(self):
+        """Return the oldest queued message without removing it (or None)"""
+        head = self._queue_head
+        if head is None and self.message_queue:
+            head = self._queue_head = self.message_queue.popleft()
+        return head
+
+    def _pop_queue(self):
+        """Remove and return the oldest queued message (or None)"""
+        head = self._peek_queue()
+        self._queue_head = None
+        return head
+
+    def _queue_len(self):
+        """Number of queued messages, including the held head"""
+        return len(self.message_queue) + (self._queue_head is not None)
+
+    def _clear_queue(self):
+        """Drop every queued message"""
+        self.message_queue = deque((), self.max_queue_size)
+        self._queue_head = None
+
+    def _expire_queue(self, now):
+        """Drop messages older than max_message_age off the front of the queue"""
+        while True:
+            head = self._peek_queue()
+            if head is None or now - head[2] <= self.max_message_age:
+                return
+            self._queue_head = None
+            feed, _, timestamp = head
+            self.messages_dropped += 1
+            age = now - timestamp
+            print(f"⏰ Dropping old message: {feed} (age: {age:.0f}s)")
 
     def _queue_message(self, message):
         """Add message to queue for later sending"""
-        # Remove oldest messages if queue is full
-        while len(self.message_queue) >= self.max_queue_size:
-            dropped = self.message_queue.pop(0)
+        self._expire_queue(time.monotonic())
+
+        # Remove oldest message if queue is full
+        if self._queue_len() >= self.max_queue_size:
+            dropped = self._pop_queue()
             self.messages_dropped += 1
-            print(f"⚠️ MQTT queue full - dropped {dropped['feed']}")
+            print(f"⚠️ MQTT queue full - dropped {dropped[0]}")
 
         self.message_queue.append(message)
         self.messages_queued += 1
-        print(
-            f"📦 MQTT message queued: {message['feed']} (queue: {len(self.message_queue)})"
-        )
-
-    def _process_queue(self):
-        """Process queued messages when connection is restored"""
-        if not self.message_queue:
-            return
-
-        print(f"📤 Processing {len(self.message_queue)} queued MQTT messages...")
-
-        # Process messages in FIFO order
-        messages_to_remove = []
-        processed_count = 0
-
-        for i, message in enumerate(self.message_queue):
-            # Check message age (don't send very old data)
-            age = time.monotonic() - message["timestamp"]
-            if age > 300:  # 5 minutes old
-                messages_to_remove.append(i)
-                print(f"⏰ Dropping old message: {message['feed']} (age: {age:.0f}s)")
-                continue
+        if self.debug:
+            print(
+                f"📦 MQTT message queued: {message[0]} (queue: {self._queue_len()})"
+            )
 
-            # Try to send the message
+    def _send_batch(self):
+        """
+        Publish queued messages back-to-back after one connection check
+        No send_interval wait or sleep between messages; one health update
+        and one network loop for the whole batch. Returns the number sent.
+        """
+        if not self.is_connected():
+            return 0
+
+        sent = 0
+        failed = False
+        # Process messages in FIFO order, popping each off the front
+        while True:
+            message = self._pop_queue()
+            if message is None:
+                break
             try:
-                send_data_to_feed(self.client, message["feed"], message["value"])
-                messages_to_remove.append(i)
-                processed_count += 1
-                self.messages_sent += 1
-
-                # Small delay between sends to avoid overwhelming
-                time.sleep(0.1)
-
+                self._send_feed(message[0], message[1])
             except Exception as e:
-                print(f"❌ Queue processing failed at message {i}: {e}")
-                # Stop processing on first failure
+                # Put it back at the front and stop on first failure
+                self._queue_head = message
+                self._handle_send_error(e)
+                failed = True
                 break
+            sent += 1
 
-        # Remove successfully sent messages (in reverse order to maintain indices)
-        for i in reversed(messages_to_remove):
-            self.message_queue.pop(i)
+        self.messages_sent += sent
+        # A failure has already dropped the client: don't report healthy
+        if sent and not failed:
+            self._send_succeeded()
+            # One network loop for the whole batch rather than one per message
+            if self.client:
+                try:
+                    self.client.loop()
+                except Exception as e:
+                    print(f"MQTT loop error: {e}")
+        return sent
 
-        if processed_count > 0:
-            print(f"✅ Successfully sent {processed_count} queued messages")
+    def _process_queue(self):
+        """Process queued messages when connection is restored"""
+        # Don't send very old data: expire it once up front
+        self._expire_queue(time.monotonic())
+        if not self._queue_len():
+            return
+
+        if self.debug:
+            print(f"📤 Processing {self._queue_len()} queued MQTT messages...")
 
-        if len(self.message_queue) > 0:
-            print(f"📦 {len(self.message_queue)} messages remain in queue")
+        processed_count = self._send_batch()
+
+        if self.debug:
+            if processed_count > 0:
+                print(f"✅ Successfully sent {processed_count} queued messages")
+            remaining = self._queue_len()
+            if remaining:
+                print(f"📦 {remaining} messages remain in queue")
 
     def update(self):
         """Update MQTT manager - call this in main loop"""
         current_time = time.monotonic()
 
-        # Attempt connection if not connected and WiFi is available
-        if not self.is_connected() and self.wifi_manager.is_connected():
-            if (current_time - self.last_connection_attempt) >= self.reconnect_interval:
-                print(
-                    f"🔄 MQTT auto-reconnect attempt (last attempt {current_time - self.last_connection_attempt:.1f}s ago)"
-                )
-                self._attempt_connection()
+        # Nothing to do for the current state until its deadline
+        if current_time >= self._next_action_at:
+            self._step(current_time)
+
+        # Send the payload staged by post_combined() (queued if not connected)
+        if self._pending is not None:
+            feeds = self._pending
+            self._pending = None
+            self._publish_feeds(feeds, self._pending_time)
+
+    def _step(self, current_time):
+        """Run the action for the current state"""
+        if self._state == _CONNECTED:
+            if self.is_connected():
+                if self._queue_len():
+                    self._process_queue()
+                self._next_action_at = current_time + self.send_interval
+                return
+            # Broker dropped us without a send error surfacing it
+            self._state = _DISCONNECTED
+
+        # DISCONNECTED: reconnect once WiFi is available
+        if not self.wifi_manager.is_connected():
+            self._next_action_at = current_time + self.reconnect_interval
+            return
 
-        # Process queue if connected and has messages
-        if self.is_connected() and self.message_queue:
-            self._process_queue()
+        print(
+            f"🔄 MQTT auto-reconnect attempt (last attempt {current_time - self.last_connection_attempt:.1f}s ago)"
+        )
+        self._attempt_connection()
 
     def get_status(self):
         """Get comprehensive MQTT status"""
+        now = time.monotonic()
+
+        # FIFO queue: the head is always the oldest message
         queue_age = 0
-        if self.message_queue:
-            oldest_message = min(self.message_queue, key=lambda m: m["timestamp"])
-            queue_age = time.monotonic() - oldest_message["timestamp"]
+        head = self._peek_queue()
+        if head is not None:
+            queue_age = now - head[2]
 
-        success_rate = 0
-        if self.connection_attempts > 0:
-            success_rate = round(
+        status = self._status
+
+        # Success rate only moves when another connection attempt is made
+        if self.connection_attempts != self._rate_attempts:
+            self._rate_attempts = self.connection_attempts
+            status["success_rate"] = round(
                 (self.successful_connections / self.connection_attempts) * 100, 1
             )
 
-        return {
-            "connected": self.is_connected(),
-            "connection_attempts": self.connection_attempts,
-            "successful_connections": self.successful_connections,
-            "consecutive_failures": self.consecutive_failures,
-            "success_rate": success_rate,
-            "messages_sent": self.messages_sent,
-            "messages_queued": len(self.message_queue),
-            "messages_dropped": self.messages_dropped,
-            "queue_age": queue_age,
-            "last_attempt": time.monotonic() - self.last_connection_attempt,
-            "next_attempt_in": max(
-                0,
-                self.reconnect_interval
-                - (time.monotonic() - self.last_connection_attempt),
-            ),
-            "error_32_count": self.error_32_count,  # ULTRA-MINIMAL ADDITION
-        }
+        since_attempt = now - self.last_connection_attempt
+        status["connected"] = self.is_connected()
+        status["connection_attempts"] = self.connection_attempts
+        status["successful_connections"] = self.successful_connections
+        status["consecutive_failures"] = self.consecutive_failures
+        status["messages_sent"] = self.messages_sent
+        status["messages_queued"] = self._queue_len()
+        status["messages_dropped"] = self.messages_dropped
+        status["queue_age"] = queue_age
+        status["last_attempt"] = since_attempt
+        status["next_attempt_in"] = (
+            max(0, self._next_action_at - now) if self._state == _DISCONNECTED else 0
+        )
+        status["error_32_count"] = self.error_32_count  # ULTRA-MINIMAL ADDITION
+        return status
 
     def disconnect(self):
         """Clean disconnect from MQTT"""
@@ -335,14 +619,18 @@ class MQTTManager:
             print(f"MQTT disconnect error: {e}")
         finally:
             self.client = None
+            self._state = _DISCONNECTED
 
     def reset(self):
         """Reset MQTT manager"""
         print("🔄 Resetting MQTT manager...")
         self.disconnect()
+        self._mqtt_client = None
         self.consecutive_failures = 0
-        self.message_queue.clear()
+        self._backoff = self.reconnect_interval
+        self._clear_queue()
         self.last_connection_attempt = 0
+        self._next_action_at = 0
         print("✅ MQTT manager reset complete")
 
     def force_reconnect(self):
@@ -350,6 +638,7 @@ class MQTTManager:
         print("🔄 Forcing MQTT reconnection...")
         self.disconnect()
         self.last_connection_attempt = 0
+        self._next_action_at = 0
         return self._attempt_connection()
 
 
@@ -362,16 +651,16 @@ class MQTTDataFormatter:
         """Format sensor readings for MQTT"""
         readings = {}
 
-        if isinstance(temp_c, (int, float)):
+        if isinstance(temp_c, _NUMERIC):
             readings["temp"] = round(temp_c, 2)
 
-        if isinstance(temp_f, (int, float)):
+        if isinstance(temp_f, _NUMERIC):
             readings[FEED_TEMPERATURE] = round(temp_f, 2)
 
-        if isinstance(ph, (int, float)):
+        if isinstance(ph, _NUMERIC):
             readings[FEED_PH] = round(ph, 3)
 
-        if isinstance(rssi, (int, float)):
+        if isinstance(rssi, _NUMERIC):
             readings[FEED_RSSI] = int(rssi)
 
         return readings
@@ -1,11 +1,32 @@
 # lib/oled_display/oled_display.py
 import displayio
 import terminalio
+import vectorio
 from adafruit_display_text import label
 import adafruit_ili9341
 from fourwire import FourWire
 import board
 
+# Label texts as (format, placeholder) pairs. The value is %-formatted
+# straight into the final text, so a label costs one string per update
+PH_TEXT = ("pH: %.3f", "pH: --")
+TEMP_C_TEXT = ("Temp: %.1f°C", "Temp: --°C")
+TEMP_F_TEXT = ("Temp: %.1f°F", "Temp: --°F")
+RSSI_TEXT = ("WiFi: %d dBm", "WiFi: -- dBm")
+
+# FourWire SPI clock. Faster than the 24 MHz default so each refresh's
+# pixel data spends less time on the bus (shared with the RTD, which sets
+# its own rate per transaction)
+DISPLAY_BAUDRATE = 40000000
+
+
+def label_text(spec, value):
+    """Format a value with a *_TEXT spec, or its placeholder if not numeric"""
+    try:
+        return spec[0] % value
+    except (TypeError, ValueError):
+        return spec[1]
+
 
 def initialize_display(shared_spi=None):
     """Initialize display with optional shared SPI bus"""
@@ -26,6 +47,7 @@ def initialize_display(shared_spi=None):
         command=board.D10,  # DC pin
         chip_select=board.D9,  # CS pin
         reset=None,  # No reset needed
+        baudrate=DISPLAY_BAUDRATE,
     )
 
     # Initialize ILI9341 display (480x320 resolution)
@@ -37,13 +59,16 @@ def initialize_display(shared_spi=None):
 def create_display_group():
     group = displayio.Group()
 
-    # Add dark blue background so we can see the display is working
-    color_bitmap = displayio.Bitmap(480, 320, 1)
+    # Add dark blue background so we can see the display is working.
+    # A vectorio shape is drawn on the fly, so unlike a full-screen 1-bit
+    # Bitmap it holds no ~19 KB pixel buffer in RAM
     color_palette = displayio.Palette(1)
     color_palette[0] = 0x000080  # Dark blue background
 
-    bg_sprite = displayio.TileGrid(color_bitmap, pixel_shader=color_palette)
-    group.append(bg_sprite)
+    background = vectorio.Rectangle(
+        pixel_shader=color_palette, width=480, height=320, x=0, y=0
+    )
+    group.append(background)
 
     # Use terminal font with scale 2 for all labels
     ph_label = label.Label(terminalio.FONT, text="pH: --", color=0xFFFFFF, x=20, y=40)
@@ -76,20 +101,79 @@ def create_display_group():
     return group, ph_label, temp_c_label, temp_f_label, rssi_label, time_label
 
 
+# Shared DisplayHandles instance, set on the first DisplayHandles.ensure()
+_handles = None
+
+
+class DisplayHandles:
+    """Display and its labels, built once and reused if init runs again"""
+
+    __slots__ = ("display", "group", "ph", "tc", "tf", "rssi", "time")
+
+    def __init__(self):
+        self.display = None
+        self.group = None
+        self.ph = None
+        self.tc = None
+        self.tf = None
+        self.rssi = None
+        self.time = None
+
+    @classmethod
+    def ensure(cls, shared_spi=None):
+        """Return the shared handles, creating the display only if needed"""
+        global _handles
+        if _handles is None:
+            _handles = cls()
+        handles = _handles
+        if handles.display is not None:
+            return handles
+
+        display = initialize_display(shared_spi=shared_spi)
+        group, ph, tc, tf, rssi, time_label = create_display_group()
+        display.root_group = group
+
+        handles.group = group
+        handles.ph = ph
+        handles.tc = tc
+        handles.tf = tf
+        handles.rssi = rssi
+        handles.time = time_label
+        # Set last so a failure part-way through is retried on the next call
+        handles.display = display
+        return handles
+
+
 def update_display(
     ph_label,
     temp_c_label,
     temp_f_label,
     rssi_label,
     time_label,
-    ph,
-    temp_c,
-    temp_f,
-    rssi,
+    ph_text,
+    temp_c_text,
+    temp_f_text,
+    rssi_text,
     time_str,
 ):
-    ph_label.text = f"pH: {ph}" if ph else "pH: --"
-    temp_c_label.text = f"Temp: {temp_c}°C" if temp_c else "Temp: --°C"
-    temp_f_label.text = f"Temp: {temp_f}°F" if temp_f else "Temp: --°F"
-    rssi_label.text = f"WiFi: {rssi} dBm" if rssi else "WiFi: -- dBm"
-    time_label.text = time_str
+    """Show label texts built with label_text()"""
+    # Hold off auto refresh so the changed labels go out in one refresh
+    # rather than one per label if a frame lands mid-update
+    display = _handles.display if _handles is not None else None
+    if display is not None:
+        display.auto_refresh = False
+    try:
+        _set_text(ph_label, ph_text)
+        _set_text(temp_c_label, temp_c_text)
+        _set_text(temp_f_label, temp_f_text)
+        _set_text(rssi_label, rssi_text)
+        _set_text(time_label, time_str)
+    finally:
+        if display is not None:
+            display.auto_refresh = True
+
+
+def _set_text(text_label, text):
+    """Assign label text only if it differs (each assignment re-lays glyphs)"""
+    if text_label.text != text:
+        text_label.text = text
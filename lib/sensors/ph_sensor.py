@@ -10,6 +10,7 @@ class AtlasScientificPH:
         self.i2c = i2c_bus
         self.address = address
         self.initialized = False
+        self.read_started = 0
 
     def send_command(self, command):
         """Send a command to the EZO circuit"""
@@ -65,13 +66,25 @@ class AtlasScientificPH:
             return False
 
     def read_ph(self):
+        if not self.start_read_ph():
+            return "Sensor initialization failed"
+        return self.finish_read_ph()
+
+    def start_read_ph(self):
+        """Send the R command without waiting for the EZO to process it"""
         # Initialize sensor on first read if not done
         if not self.initialized:
             if not self.initialize_sensor():
-                return "Sensor initialization failed"
+                return False
 
         self.send_command("R")
-        code, response = self.read_response()
+        self.read_started = time.monotonic()
+        return True
+
+    def finish_read_ph(self, wait_time=0.9):
+        """Collect a reading started by start_read_ph(), waiting only for the remaining processing time"""
+        elapsed = time.monotonic() - self.read_started
+        code, response = self.read_response(max(0, wait_time - elapsed))
         if code == 1:
             try:
                 return float(response)